@@ -16,6 +16,7 @@
 # along with Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
 import math
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.graphics.opengl import glGetIntegerv, GL_MAX_TEXTURE_SIZE
 from kivy.logger import Logger
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -25,6 +26,9 @@ from license_label import LicenseLabel
 __version__ = '1.0.0'
 
 class About(MDBoxLayout):
+    layout_width = None
+    license_labels = []
+    license_lines = []
 
     def __init__(self, **kwargs):
         """
@@ -36,48 +40,108 @@ class About(MDBoxLayout):
         super().__init__(**kwargs)
         self.load_license_text()
 
+    def get_chunk_layout(self, license_lines, width, app=None):
+        """
+        get_chunk_layout
+        args: self - self object
+            license_lines - list of license text lines
+            width - width of the license container in pixels
+            app - optional app object
+        purpose: get the license chunk layout for this container width, font size and GL texture limit from config,
+            measuring it and storing it in place of the previous one when it is not known yet
+        returns: list of lists of first line, end line and rendered height of each chunk
+        """
+        app = app if app else App.get_running_app()
+        max_texture_size = glGetIntegerv(GL_MAX_TEXTURE_SIZE)[0]
+        layout_key = f"{int(width)}x{app.app_data_dict['window height']} {max_texture_size}"
+        layouts = app.app_data_dict['config'].get('license', {}).get('layouts', {})
+        if layout_key not in layouts:
+            layouts = {layout_key: self.measure_chunk_layout(license_lines,
+                min(max_texture_size, app.app_data_dict['window height'] * 4), width)}
+            app.app_data_dict['config']['license'] = {'layouts': layouts}
+            app.app_data_dict['unpickleable']['database'].store_config(app.app_data_dict['config'])
+        return layouts[layout_key]
+
+    def layout_license_chunks(self, *kwargs):
+        """
+        layout_license_chunks
+        args: self - self object
+            kwargs - extra arguments from Clock
+        purpose: fill the license container with placeholder chunks measured at its laid out width, again whenever
+            the width changes
+        """
+        container = self.ids['license_container_id']
+        if container.width == self.layout_width:
+            return
+        self.layout_width = container.width
+        container.clear_widgets()
+        self.license_labels = []
+        for first_line, end_line, height in self.get_chunk_layout(self.license_lines, container.width):
+            label = LicenseLabel(chunk_text=''.join(self.license_lines[first_line:end_line]), chunk_height=height)
+            self.license_labels.append(label)
+            container.add_widget(label)
+        Logger.info('about: License laid out in {} parts'.format(len(self.license_labels)))
+
     def load_license_text(self):
         """
         load_licsene_text
         args: self - self object
-        purpose: load license text into slider view
+        purpose: load license text into slider view as placeholder chunks, laid out once the container has its width,
+            that are rendered as they scroll into view
         """
-        app = App.get_running_app()
-        license_lines = []
         with open('license.txt', 'r') as file:
-            license_lines = file.readlines()
+            self.license_lines = file.readlines()
+        self.license_labels = []
+        render_trigger = Clock.create_trigger(self.render_visible_chunks)
+        self.ids['license_container_id'].bind(size=render_trigger, width=Clock.create_trigger(
+            self.layout_license_chunks))
+        self.ids['license_scroll_id'].bind(scroll_y=render_trigger, size=render_trigger)
+        Logger.info('about: License loaded with {} lines'.format(len(self.license_lines)))
+
+    def measure_chunk_layout(self, license_lines, chunk_limit, width):
+        """
+        measure_chunk_layout
+        args: self - self object
+            license_lines - list of license text lines
+            chunk_limit - maximum rendered height of a chunk in pixels
+            width - width to measure the chunks at in pixels
+        purpose: split the license into the fewest equal line count chunks whose textures fit under the limit
+        returns: list of lists of first line, end line and rendered height of each chunk
+        """
         num_of_lines = len(license_lines)
-        max_texture_size = glGetIntegerv(GL_MAX_TEXTURE_SIZE)[0]
-        labels = []
-        if 'license' in app.app_data_dict['config']:
-            divider = app.app_data_dict['config']['license']['chunk count']
-            loop = True
-        else:
-            labels.append(LicenseLabel(text = ''.join(license_lines)))
-            self.ids['license_container_id'].add_widget(labels[0])
-            labels[0].texture_update()
-            divider = math.ceil(labels[0].texture_size[1] / max_texture_size)
-            loop = bool(divider != 1)
-        while loop:
+        label = LicenseLabel(width=width)
+        label.text = ''.join(license_lines)
+        label.texture_update()
+        divider = math.ceil(label.texture_size[1] / chunk_limit)
+        while True:
             Logger.info('about: divider = {}'.format(divider))
             split_line_count = math.ceil(num_of_lines / divider)
-            list_in_list = [license_lines[i:i + split_line_count] for i in range(0, num_of_lines, split_line_count)]
-            for label_index, license_lines_part in enumerate(list_in_list):
-                label_text = ''.join(license_lines_part)
-                if label_index == len(labels):
-                    labels.append(LicenseLabel(text = label_text))
-                    self.ids['license_container_id'].add_widget(labels[label_index])
-                else:
-                    labels[label_index].text = label_text
-                license_label = labels[label_index]
-                license_label.texture_update()
-                Logger.info('about: texture_size = {}'.format(license_label.texture_size))
-                if license_label.texture_size[1] > max_texture_size:
-                    divider += 1
-                    loop = True
+            layout = []
+            for first_line in range(0, num_of_lines, split_line_count):
+                end_line = min(first_line + split_line_count, num_of_lines)
+                label.text = ''.join(license_lines[first_line:end_line])
+                label.texture_update()
+                Logger.info('about: texture_size = {}'.format(label.texture_size))
+                if label.texture_size[1] > chunk_limit:
                     break
-                else:
-                    loop = False
-        Logger.info('about: License loaded in {} parts'.format(divider))
-        app.app_data_dict['config']['license'] = {'chunk count': divider}
+                layout.append([first_line, end_line, label.texture_size[1]])
+            else:
+                return layout
+            divider += 1
 
+    def render_visible_chunks(self, *kwargs):
+        """
+        render_visible_chunks
+        args: self - self object
+            kwargs - extra arguments from Clock
+        purpose: render the license chunks within a screen height of the visible part of the scroll view, comparing
+            in the container's coordinates since the scroll view scrolls by translating rather than moving it
+        """
+        scroll = self.ids['license_scroll_id']
+        container = self.ids['license_container_id']
+        visible_bottom = container.y + scroll.scroll_y * max(container.height - scroll.height, 0)
+        visible_top = visible_bottom + scroll.height
+        for label in self.license_labels:
+            if not label.text and label.top >= visible_bottom - scroll.height and \
+                    label.y <= visible_top + scroll.height:
+                label.text = label.chunk_text
@@ -15,7 +15,6 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
-import os
 from kivy.config import Config
 #local import
 import pantheon_util
@@ -28,19 +27,17 @@ def main():
     """
     Config.set('graphics', 'allow_screensaver', False)
     Config.set('kivy', 'exit_on_escape', False)
-    if not os.path.exists('scale.kv'):
-        with open('scale.kv', 'w') as file:
-            file.write('#:set window_width 360\n#:set window_height 720\n')
-    loop = True
-    while loop:
-        loop = run()
+    run()
 
 def run():
+    """
+    run
+    purpose: size and run the app
+    """
     data_root = {}
     data_root['window width'], data_root['window height'] = pantheon_util.determine_screen_size()
     app = view.AdonisBuddyApp(data_root)
     app.run()
-    return True if 'reset' in data_root and data_root['reset'] else False
 
 if __name__ == '__main__':
     main()
@@ -24,6 +24,7 @@ from text_input_util import TextInputUtil
 
 class BodyMeasurements(MDBoxLayout, TextInputUtil, ImageTouchUtil):
     all_input_fields = {}
+    base_image_file = 'measurement-model.png'
     keyboard_button = None
     screen_name = 'circumference'
 
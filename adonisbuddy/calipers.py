@@ -15,7 +15,6 @@
 # You should have received a copy of the GNU General Public License
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
-import os
 from collections import OrderedDict
 from kivy.app import App
 from kivy.clock import Clock
@@ -30,6 +29,7 @@ from image_touch_util import ImageTouchUtil
 
 class Calipers(MDBoxLayout, TextInputUtil, ImageTouchUtil):
     all_input_fields = OrderedDict()
+    base_image_file = 'caliper-model.png'
     percentage = StringProperty('0.0%')
     screen_name = 'calipers'
 
@@ -122,16 +122,15 @@ class Calipers(MDBoxLayout, TextInputUtil, ImageTouchUtil):
         Logger.info(f'calipers: set_focus')
         ret_flag = super().set_focus(input_field, *kwargs)
         app = App.get_running_app()
-        image_map = app.app_data_dict['unpickleable']['image map']
         found = False
         for key, field in self.all_input_fields.items():
             if field.focus:
-                self.ids['select_image_id'].source = \
-                    os.path.join('images', image_map[key.split('_', 1)[0]][self.screen_name]['display image file'])
+                self.show_selection(key.split('_', 1)[0], app=app)
                 found = True
                 break
         if not found:
-            self.ids['select_image_id'].source = os.path.join('images', 'caliper-model.png')
+            self.clear_highlight()
+            self.show_image(self.base_image_file, app=app)
         return ret_flag
 
     def store_caliper_data(self, *kwargs):
@@ -143,12 +142,12 @@ class Calipers(MDBoxLayout, TextInputUtil, ImageTouchUtil):
         """
         app = App.get_running_app()
         app.app_data_dict['unpickleable']['confirmation popup'].dismiss()
-        db = app.app_data_dict['unpickleable']['database']
         skinfold1 = float(self.ids['chest_field_id'].text or 0)
-        db.store_measurement('chest pinch', skinfold1, 'mm', 'calipers', 2.0)
         skinfold2 = float(self.ids['waist_field_id'].text or 0)
-        db.store_measurement('waist pinch', skinfold2, 'mm', 'calipers', 2.1)
         skinfold3 = float(self.ids['thigh_field_id'].text or 0)
-        db.store_measurement('thigh pinch', skinfold3, 'mm', 'calipers', 2.3)
         bf = self.calculate_bf(skinfold1, skinfold2, skinfold3)
-        db.store_measurement('body fat', bf, 'percent', 'calipers', 2.4)
+        app.app_data_dict['unpickleable']['database'].store_measurements([
+            ('chest pinch', skinfold1, 'mm', 'calipers', 2.0),
+            ('waist pinch', skinfold2, 'mm', 'calipers', 2.1),
+            ('thigh pinch', skinfold3, 'mm', 'calipers', 2.3),
+            ('body fat', bf, 'percent', 'calipers', 2.4)])
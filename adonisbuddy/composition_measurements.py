@@ -22,6 +22,7 @@ from kivy.logger import Logger
 from kivy.properties import StringProperty
 from kivymd.uix.boxlayout import MDBoxLayout
 # local imports
+import display_geometry
 import over_press
 import soft_keyboard
 from text_input_util import TextInputUtil
@@ -30,6 +31,7 @@ from workout_text_field import WorkoutTextField
 class CompositionMeasurements(MDBoxLayout, TextInputUtil):
     all_input_fields = OrderedDict()
     dob_string = StringProperty('NOT SET')
+    pending_measurements = []
 
     def __init__(self, **kwargs):
         """
@@ -42,9 +44,9 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         app = App.get_running_app()
         self.all_input_fields['height_foot_id'] = self.ids['height_foot_id']
         self.all_input_fields['height_inch_id'] = self.ids['height_inch_id']
-        self.all_input_fields['height_cm_id'] = WorkoutTextField(field_name='height_cm_id',
-            font_size=app.app_data_dict['window height'] // 30, hint_text='CM', input_field_type='int',
-            input_filter='int', size_hint_x=0.8, disabled=True)
+        self.all_input_fields['height_cm_id'] = display_geometry.bind_window_height(WorkoutTextField(
+            field_name='height_cm_id', hint_text='CM', input_field_type='int', input_filter='int', size_hint_x=0.8,
+            disabled=True), 'font_size', 30, app=app)
         self.all_input_fields['weight_id'] = self.ids['weight_id']
         self.all_input_fields['body_fat_measurement_id'] = self.ids['body_fat_measurement_id']
         self.all_input_fields['body_fat_measurement_type_id'] = self.ids['body_fat_measurement_type_id']
@@ -90,6 +92,8 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
                 Clock.schedule_once(self.confirm_replace_heart, 0.5)
             else:
                 self.store_heart_rate()
+        else:
+            self.store_pending_measurements()
 
     def check_height_save(self, *kwargs):
         """
@@ -151,7 +155,8 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         """
         app = App.get_running_app()
         app.app_data_dict['unpickleable']['confirmation popup'].open_confirm_popup(
-            "Replace today's recorded heart rate?", self.store_heart_rate)
+            "Replace today's recorded heart rate?", self.store_heart_rate,
+            cancel_bind_method=self.store_pending_measurements)
 
     def confirm_replace_height(self, dt):
         """
@@ -208,6 +213,7 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         Logger.info(f'composition_measurements: save_metrics')
         app = App.get_running_app()
         if over_press.protect(app=app, vibrate=True):
+            self.pending_measurements = []
             if self.dob_string in ('NOT SET', app.app_data_dict['global properties']['birth date']):
                 self.check_height_save()
             else:
@@ -240,7 +246,7 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         unpickleable = app.app_data_dict['unpickleable']
         unpickleable['confirmation popup'].dismiss()
         app.app_data_dict['global properties']['birth date'] = self.dob_string
-        unpickleable['database'].store_measurement('birth date', self.dob_string, 'iso format date', None, 0)
+        self.pending_measurements.append(('birth date', self.dob_string, 'iso format date', None, 0))
         self.check_height_save()
 
     def store_body_fat(self, *kwargs):
@@ -253,8 +259,8 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         app = App.get_running_app()
         unpickleable = app.app_data_dict['unpickleable']
         unpickleable['confirmation popup'].dismiss()
-        unpickleable['database'].store_measurement('body fat', float(self.ids['body_fat_measurement_id'].text),
-            'percent', (self.ids['body_fat_measurement_type_id'].text or None), 3.3)
+        self.pending_measurements.append(('body fat', float(self.ids['body_fat_measurement_id'].text), 'percent',
+            (self.ids['body_fat_measurement_type_id'].text or None), 3.3))
         self.check_heart_save()
 
     def store_heart_rate(self, *kwargs):
@@ -267,8 +273,8 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         app = App.get_running_app()
         unpickleable = app.app_data_dict['unpickleable']
         unpickleable['confirmation popup'].dismiss()
-        unpickleable['database'].store_measurement('heart rate', float(self.ids['heart_rate_id'].text), 'bpm', None,
-                                                   3.2)
+        self.pending_measurements.append(('heart rate', float(self.ids['heart_rate_id'].text), 'bpm', None, 3.2))
+        self.store_pending_measurements()
 
     def store_height(self, *kwargs):
         """
@@ -280,16 +286,28 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         app = App.get_running_app()
         unpickleable = app.app_data_dict['unpickleable']
         unpickleable['confirmation popup'].dismiss()
-        db = unpickleable['database']
         if self.all_input_fields['height_cm_id'].disabled:
             inches = (float(self.all_input_fields['height_foot_id'].text) * 12.0 +
                 float(self.all_input_fields['height_inch_id'].text))
-            db.store_measurement('height', inches, 'in', None, 3.0)
+            self.pending_measurements.append(('height', inches, 'in', None, 3.0))
         else:
             cm = float(self.all_input_fields['height_cm_id'].text)
-            db.store_measurement('height', cm, 'cm', None, 3.0)
+            self.pending_measurements.append(('height', cm, 'cm', None, 3.0))
         self.check_weight_save()
 
+    def store_pending_measurements(self, *kwargs):
+        """
+        store_pending_measurements
+        args: self - self object
+            kwargs - kivy arguments which contains button widget if called from popup
+        purpose: write the measurements collected by the save chain to database in one batch
+        """
+        app = App.get_running_app()
+        unpickleable = app.app_data_dict['unpickleable']
+        unpickleable['confirmation popup'].dismiss()
+        pending_measurements, self.pending_measurements = self.pending_measurements, []
+        unpickleable['database'].store_measurements(pending_measurements)
+
     def store_weight(self, *kweargs):
         """
         store_weight
@@ -300,8 +318,8 @@ class CompositionMeasurements(MDBoxLayout, TextInputUtil):
         app = App.get_running_app()
         unpickleable = app.app_data_dict['unpickleable']
         unpickleable['confirmation popup'].dismiss()
-        unpickleable['database'].store_measurement('weight', float(self.ids['weight_id'].text),
-            self.ids['weight_unit_id'].text, None, 3.1)
+        self.pending_measurements.append(('weight', float(self.ids['weight_id'].text), self.ids['weight_unit_id'].text,
+            None, 3.1))
         self.check_body_fat_save()
 
     def toggle_height_unit_button_press(self):
@@ -19,6 +19,8 @@ from kivy.utils import platform
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDIconButton
 # local imports
+import display_geometry
+import lazy_screen
 import soft_keyboard
 from mb_config import Config as MBConfig
 
@@ -33,11 +35,14 @@ class Config(MBConfig):
         """
         super(MDBoxLayout, self).__init__(**kwargs)
         app = App.get_running_app()
-        app.app_data_dict['unpickleable']['vibrate toggle method'] = self.toggle_vibrate
+        unpickleable = app.app_data_dict['unpickleable']
+        unpickleable['vibrate toggle method'] = self.toggle_vibrate
         config = app.app_data_dict['config']
         if platform == 'linux':
-            app.app_data_dict['unpickleable']['hardware keyboard toggle method'] = self.toggle_hardware_keyboard
+            unpickleable['hardware keyboard toggle method'] = self.toggle_hardware_keyboard
             self.enable_button('hardware keyboard')
+        if 'vibrator' in unpickleable and unpickleable['vibrator'].vibrator_found:
+            self.enable_button('vibrate')
         self.set_config_gui(config['software keyboard']['active'], 'software keyboard', app=app)
 
     def disable_soft_keyboard(self):
@@ -50,7 +55,8 @@ class Config(MBConfig):
         soft_keyboard.remove_soft_keyboard()
         unpickleable = app.app_data_dict['unpickleable']
         for key in ('body measurements', 'calipers', 'composition'):
-            unpickleable[key].ids['keypad_button_container_id'].clear_widgets()
+            if lazy_screen.is_built(unpickleable[key]):
+                unpickleable[key].ids['keypad_button_container_id'].clear_widgets()
 
     def enable_soft_keyboard(self):
         """
@@ -60,8 +66,9 @@ class Config(MBConfig):
         """
         app = App.get_running_app()
         unpickleable = app.app_data_dict['unpickleable']
-        size = app.app_data_dict['window height'] // 19
         for key in ('body measurements', 'calipers', 'composition'):
-            button = MDIconButton(icon='keyboard-outline', icon_size=size)
-            unpickleable[key].ids['keypad_button_container_id'].add_widget(button)
-            button.bind(on_release=unpickleable[key].summon_keyboard_press)
+            if lazy_screen.is_built(unpickleable[key]):
+                button = display_geometry.bind_window_height(MDIconButton(icon='keyboard-outline'), 'icon_size', 19,
+                    app=app)
+                unpickleable[key].ids['keypad_button_container_id'].add_widget(button)
+                button.bind(on_release=unpickleable[key].summon_keyboard_press)
@@ -15,30 +15,87 @@
 # You should have received a copy of the GNU General Public License
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
+import functools
+import json
 import os
 import sqlite3
+from collections import OrderedDict
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.logger import Logger
 # local imports
 import database_util
+import lazy_screen
 
 class Database:
     app_db = None
+    cached_statements = 64
+    config_snapshot = None
+    config_store_delay = 0.5
+    config_store_event = None
+    executor = None
+    journal_drain_timeout = 2
+    journal_file = os.path.join('database', 'measurements.journal')
+    journal_flush_delay = 0.25
+    journal_flush_event = None
+    journal_flushing = False
+    journal_pending = None
+    journal_quarantine_file = os.path.join('database', 'measurements.quarantine')
+    journal_retry_delay = 0.5
+    journal_retry_max = 30
+    journal_sequence = 0
+    measurement_cache = None
+    measurement_cache_hits = 0
+    measurement_cache_limit = 64
+    measurement_cache_misses = 0
     metrics_db = None
+    month_dates_cache = None
+    transient_errors = ('busy', 'disk i/o', 'locked')
+    statements = {
+        'get measurement': 'SELECT * FROM measurements WHERE date = ? AND name = ?',
+        'get measurement by method': 'SELECT * FROM measurements WHERE date = ? AND name = ? AND measure_method = ?',
+        'get measurement dates': 'SELECT DISTINCT date FROM measurements ORDER BY date DESC LIMIT ?',
+        'get measurement dates before':
+            'SELECT DISTINCT date FROM measurements WHERE date < ? ORDER BY date DESC LIMIT ?',
+        'get measurement dates by range': 'SELECT DISTINCT date FROM measurements WHERE date >= ? AND date < ?',
+        'get measurement null method':
+            'SELECT * FROM measurements WHERE date = ? AND name = ? AND measure_method IS NULL',
+        'upsert measurement': """
+            INSERT INTO measurements
+            (date, name, value, unit_type, measure_method, sort_key)
+            VALUES(?, ?, ?, ?, ?, ?)
+            ON CONFLICT(date, name, IFNULL(measure_method, '')) DO UPDATE
+            SET value = excluded.value,
+                unit_type = excluded.unit_type
+        """
+    }
 
-    def __init__(self):
+    def __init__(self, executor=None):
         """
         __init__
         args: self - self object
+            executor - optional DatabaseExecutor for queries run off the UI thread, it is told about writes and the
+                database given one owns the measurement journal
         purpose: initialize database object
         """
+        self.config_snapshot = {}
+        self.executor = executor
+        self.journal_pending = []
+        self.measurement_cache = OrderedDict()
+        self.month_dates_cache = {}
         if not os.path.exists('database'):
             os.makedirs('database')
         app_db_file = os.path.join('database', 'app.sqlite3')
-        self.app_db = sqlite3.connect(app_db_file) if os.path.exists(app_db_file) else \
+        self.app_db = self.connect(app_db_file) if os.path.exists(app_db_file) else \
             self.create_app_database(app_db_file)
         metrics_db_file = os.path.join('database', 'metrics.sqlite3')
-        self.metrics_db = sqlite3.connect(metrics_db_file) if os.path.exists(metrics_db_file) else \
-            self.create_metrics_database(metrics_db_file)
+        if os.path.exists(metrics_db_file):
+            self.metrics_db = self.connect(metrics_db_file)
+            self.create_measurements_index(self.metrics_db)
+        else:
+            self.metrics_db = self.create_metrics_database(metrics_db_file)
+        if self.executor:
+            self.load_journal()
 
     def __exit__(self):
         """
@@ -51,6 +108,41 @@ class Database:
         self.metrics_db.commit()
         self.metrics_db.close()
 
+    def append_journal(self, date_str, batch):
+        """
+        append_journal
+        args: self - self object
+            date_str - ISO format date string of measurements
+            batch - list of tuples of name, value, unit type, measure method and sort key
+        purpose: acknowledge measurements into the pending list and have the database executor durably append them
+            to the journal ahead of flushing them to the metrics database, they can be lost to a crash only in the
+            moment before the executor reaches the append, a failed append is reported back by journal_write_failed
+        """
+        entries = []
+        for name, value, unit_type, measure_method, sort_key in batch:
+            self.journal_sequence += 1
+            entries.append({'id': self.journal_sequence, 'date': date_str, 'name': name, 'value': value,
+                'unit_type': unit_type, 'measure_method': measure_method, 'sort_key': sort_key})
+        self.journal_pending.extend(entries)
+        self.queue_journal_write(entries)
+        if not self.journal_flush_event:
+            self.journal_flush_event = Clock.schedule_once(self.flush_journal, self.journal_flush_delay)
+
+    def connect(self, database_file_name):
+        """
+        connect
+        args: self - self object
+            database_file_name - database file name
+        purpose: open a database connection with WAL journaling, relaxed syncing, sqlite3.Row results and a
+            prepared statement cache
+        returns: open sqlite3 database object
+        """
+        conn = sqlite3.connect(database_file_name, cached_statements=self.cached_statements)
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.row_factory = sqlite3.Row
+        return conn
+
     def create_app_database(self, database_file_name):
         """
         create_app_database
@@ -59,13 +151,43 @@ class Database:
         purpose: create an fresh Adonis Buddy app database
         returns: open sqlite3 database object for the app database
         """
-        conn = sqlite3.connect(database_file_name)
+        conn = self.connect(database_file_name)
         curs = conn.cursor()
         database_util.create_config_table(curs)
         conn.commit()
         curs.close()
         return conn
 
+    def create_measurements_index(self, conn):
+        """
+        create_measurements_index
+        args: self - self object
+            conn - open metrics database
+        purpose: create the unique index used by measurement upserts, pruning duplicate NULL method rows first after
+            logging them and copying them to the quarantine file
+        """
+        index = database_util.basic_query(conn,
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'measurements_date_name_method'")
+        if not index:
+            duplicates_sql = """
+                FROM measurements
+                WHERE rowid NOT IN (
+                    SELECT MAX(rowid)
+                    FROM measurements
+                    GROUP BY date, name, IFNULL(measure_method, ''))
+            """
+            duplicates = [dict(row) for row in database_util.basic_query(conn, 'SELECT * ' + duplicates_sql)]
+            if duplicates:
+                Logger.info(f'database: pruning {len(duplicates)} duplicate measurements, copied to '
+                    f'{self.journal_quarantine_file}')
+                self.quarantine_journal_entries(duplicates)
+            conn.execute('DELETE ' + duplicates_sql)
+            conn.execute("""
+                CREATE UNIQUE INDEX "measurements_date_name_method"
+                ON "measurements" ("date", "name", IFNULL("measure_method", ''))
+            """)
+            conn.commit()
+
     def create_measurements_table(self, curs):
         """
         create_measurements_table
@@ -94,13 +216,68 @@ class Database:
         purpose: create an fresh Adonis Buddy metrics database
         returns: open sqlite3 database object for the app database
         """
-        conn = sqlite3.connect(database_file_name)
+        conn = self.connect(database_file_name)
         curs = conn.cursor()
         self.create_measurements_table(curs)
         conn.commit()
         curs.close()
+        self.create_measurements_index(conn)
         return conn
 
+    def drain_journal(self, timeout=None):
+        """
+        drain_journal
+        args: self - self object
+            timeout - optional seconds to wait, defaults to journal_drain_timeout
+        purpose: at exit, store every pending journal entry behind the appends and flushes already queued on the
+            database executor and wait a bounded time for it, emptying the journal once they are committed
+        returns: boolean indicator as to if every pending entry was committed
+        """
+        if self.journal_flush_event:
+            self.journal_flush_event.cancel()
+            self.journal_flush_event = None
+        if not self.journal_pending:
+            return True
+        timeout = self.journal_drain_timeout if timeout is None else timeout
+        try:
+            if self.executor.submit('store_journal_entries', list(self.journal_pending)).result(timeout) is None:
+                Logger.info('database: drain_journal: entries left in the journal for the next start')
+                return False
+            self.executor.submit('truncate_journal').result(timeout)
+            self.journal_pending = []
+            return True
+        except Exception as e:
+            Logger.info(f'database: drain_journal: entries left in the journal for the next start: {e}')
+            return False
+
+    def flush_config(self, *kwargs):
+        """
+        flush_config
+        args: self - self object
+            kwargs - extra arguments from Clock
+        purpose: write pending config changes now, cancelling any scheduled store
+        returns: list of keys written
+        """
+        if self.config_store_event:
+            self.config_store_event.cancel()
+            self.config_store_event = None
+        return self.store_config(App.get_running_app().app_data_dict['config'])
+
+    def flush_journal(self, *kwargs):
+        """
+        flush_journal
+        args: self - self object
+            kwargs - extra arguments from Clock
+        purpose: hand the pending journal entries to the database executor to be written in one transaction
+        """
+        self.journal_flush_event = None
+        if self.journal_pending and not self.journal_flushing:
+            self.journal_flushing = True
+            entries = list(self.journal_pending)
+            future = self.executor.submit('store_journal_entries', entries,
+                callback=functools.partial(self.journal_flushed, entries[-1]['id']))
+            future.add_done_callback(functools.partial(self.journal_flush_done, entries[-1]['id']))
+
     def get_circumference_images(self):
         """
         get_circumference_images
@@ -128,28 +305,54 @@ class Database:
             date - date string
             name - name of measurement
             measurement_method - optional measurement method
-        purpose: retrieve measurement from database
+        purpose: retrieve measurement, from the read-through cache when it was looked up since it was last stored
         returns: list of data dictionaries of measurement
         """
+        key = (date, name, measurement_method)
+        if key in self.measurement_cache:
+            self.measurement_cache_hits += 1
+            self.measurement_cache.move_to_end(key)
+            return list(self.measurement_cache[key])
+        self.measurement_cache_misses += 1
         if measurement_method is False:
-            return database_util.basic_query(self.metrics_db,
-                'SELECT * FROM measurements WHERE date = ? AND name = ?', values=(date, name))
+            rows = database_util.basic_query(self.metrics_db, self.statements['get measurement'],
+                values=(date, name))
         elif measurement_method is None:
-            return database_util.basic_query(self.metrics_db,
-                'SELECT * FROM measurements WHERE date = ? AND name = ? AND measure_method IS NULL',
+            rows = database_util.basic_query(self.metrics_db, self.statements['get measurement null method'],
                 values=(date, name))
         else:
-            return database_util.basic_query(self.metrics_db,
-                'SELECT * FROM measurements WHERE date = ? AND name = ? AND measure_method = ?',
+            rows = database_util.basic_query(self.metrics_db, self.statements['get measurement by method'],
                 values=(date, name, measurement_method))
+        self.measurement_cache[key] = self.overlay_journal(rows, date, name, measurement_method)
+        while len(self.measurement_cache) > self.measurement_cache_limit:
+            self.measurement_cache.popitem(last=False)
+        return list(self.measurement_cache[key])
+
+    def get_measurement_dates(self, limit, before_date=None):
+        """
+        get_measurement_dates
+        args: self - self object
+            limit - maximum number of dates to return
+            before_date - optional ISO date string to page from, exclusive
+        purpose: retrieve a page of distinct measurement dates, newest first
+        returns: list of dictionaries of ISO format date strings
+        """
+        if before_date is None:
+            return database_util.basic_query(self.metrics_db, self.statements['get measurement dates'],
+                values=(limit,))
+        return database_util.basic_query(self.metrics_db, self.statements['get measurement dates before'],
+            values=(before_date, limit))
 
     def get_birth_date(self):
         """
         get_birth_date
         args: self - self object
-        purpose: retrieve birthdate from database
+        purpose: retrieve birthdate from database, or from the journal if a newer one is not flushed yet
         returns: ISO formated birth date string
         """
+        pending = [entry for entry in self.journal_pending if entry['name'] == 'birth date']
+        if pending:
+            return [{'value': pending[-1]['value']}]
         return database_util.basic_query(self.metrics_db,
             "SELECT value FROM measurements WHERE name = 'birth date' ORDER BY date DESC LIMIT 1")
 
@@ -180,12 +383,15 @@ class Database:
         args: self - self object
             year - year to match on
             month - month to match on
-        purpose: return list of workout days for datepicker cosmetics
+        purpose: return list of workout days for datepicker cosmetics, cached per month until a store invalidates it
         returns: list of dictionaries of ISO format date strings
         """
-        date_str = f'{year:04}-{month:02}-%'
-        sql = 'SELECT DISTINCT date FROM measurements WHERE date LIKE ?'
-        return database_util.basic_query(self.metrics_db, sql, values=(date_str,))
+        if (year, month) not in self.month_dates_cache:
+            start_str = f'{year:04}-{month:02}-01'
+            end_str = f'{year + month // 12:04}-{month % 12 + 1:02}-01'
+            self.month_dates_cache[(year, month)] = database_util.basic_query(self.metrics_db,
+                self.statements['get measurement dates by range'], values=(start_str, end_str))
+        return self.month_dates_cache[(year, month)]
 
     def get_sound_files(self):
         """
@@ -195,6 +401,274 @@ class Database:
         """
         return []
 
+    def invalidate_measurement(self, date_str, name, measure_method):
+        """
+        invalidate_measurement
+        args: self - self object
+            date_str - ISO format date string of a stored measurement
+            name - name of stored measurement
+            measure_method - method of stored measurement
+        purpose: drop the cached lookups a stored measurement changes, the one for its method and the one for any method
+        """
+        self.measurement_cache.pop((date_str, name, measure_method), None)
+        self.measurement_cache.pop((date_str, name, False), None)
+
+    def invalidate_month_dates(self, date):
+        """
+        invalidate_month_dates
+        args: self - self object
+            date - datetime.date object of a stored measurement
+        purpose: drop the cached datepicker days for the month of date, here and in the executor's database
+        """
+        self.month_dates_cache.pop((date.year, date.month), None)
+        if self.executor:
+            self.executor.submit('invalidate_month_dates', date)
+
+    def is_transient_error(self, error):
+        """
+        is_transient_error
+        args: self - self object
+            error - exception raised writing to the database
+        purpose: tell a busy, locked or I/O failure that is worth retrying from one the same write will always hit
+        returns: boolean indicator as to if the write should be retried
+        """
+        if isinstance(error, OSError):
+            return True
+        return isinstance(error, sqlite3.OperationalError) and any(transient in str(error).lower()
+            for transient in self.transient_errors)
+
+    def journal_flush_done(self, last_id, future):
+        """
+        journal_flush_done
+        args: self - self object
+            last_id - id of the last journal entry in the flushed batch
+            future - concurrent.futures.Future of the flush
+        purpose: run on the database thread when a flush finishes, a flush that raised, such as when the executor
+            cannot open its connections, is backed off and retried like one that was not committed
+        """
+        if future.exception():
+            Clock.schedule_once(functools.partial(self.journal_flushed, last_id, None))
+
+    def journal_flushed(self, last_id, quarantined, *kwargs):
+        """
+        journal_flushed
+        args: self - self object
+            last_id - id of the last journal entry in the flushed batch
+            quarantined - list of entries moved to the quarantine file, None if the batch was not committed
+            kwargs - extra arguments from Clock
+        purpose: drop committed entries, refresh what reads them and empty the journal once everything is stored, or
+            back off and retry
+        """
+        self.journal_flushing = False
+        if quarantined is None:
+            Logger.info(f'database: journal flush failed, retrying in {self.journal_retry_delay} s')
+            self.journal_flush_event = Clock.schedule_once(self.flush_journal, self.journal_retry_delay)
+            self.journal_retry_delay = min(self.journal_retry_delay * 2, self.journal_retry_max)
+            return
+        self.journal_retry_delay = Database.journal_retry_delay
+        flushed = [entry for entry in self.journal_pending if entry['id'] <= last_id]
+        self.journal_pending = [entry for entry in self.journal_pending if entry['id'] > last_id]
+        for entry in quarantined:
+            self.invalidate_measurement(entry['date'], entry['name'], entry['measure_method'])
+        for date_str in {entry['date'] for entry in flushed}:
+            self.invalidate_month_dates(datetime.date.fromisoformat(date_str))
+        quarantined_ids = {entry['id'] for entry in quarantined}
+        today = datetime.date.today().isoformat()
+        stored_today = [(entry['name'], entry['value'], entry['unit_type'], entry['measure_method'],
+            entry['sort_key']) for entry in flushed if entry['date'] == today and entry['id'] not in quarantined_ids]
+        if stored_today:
+            self.update_history(stored_today)
+        if self.journal_pending:
+            self.flush_journal()
+        else:
+            self.executor.submit('truncate_journal')
+
+    def journal_write_done(self, entries, future):
+        """
+        journal_write_done
+        args: self - self object
+            entries - list of journal entry dictionaries appended
+            future - concurrent.futures.Future of the append
+        purpose: run on the database thread when an append finishes, a failed append is reported on the UI thread
+        """
+        if future.exception():
+            Clock.schedule_once(functools.partial(self.journal_write_failed, entries, future.exception()))
+
+    def journal_write_failed(self, entries, error, *kwargs):
+        """
+        journal_write_failed
+        args: self - self object
+            entries - list of journal entry dictionaries that could not be appended
+            error - exception raised by the append
+            kwargs - extra arguments from Clock
+        purpose: warn that acknowledged measurements not flushed yet exist only in memory and offer to retry the
+            append
+        """
+        pending_ids = {entry['id'] for entry in self.journal_pending}
+        entries = [entry for entry in entries if entry['id'] in pending_ids]
+        Logger.info(f'database: journal append failed with {len(entries)} measurements unflushed: {error}')
+        if entries:
+            App.get_running_app().app_data_dict['unpickleable']['confirmation popup'].open_confirm_popup(
+                'Measurement journal write failure. Retry?', functools.partial(self.retry_journal_write, entries),
+                over_press_protected=True)
+
+    def load_config(self):
+        """
+        load_config
+        args: self - self object
+        purpose: load the app config and remember what was loaded so later stores only write changed keys
+        returns: dictionary containing app config
+        """
+        config = database_util.get_config(self.app_db)
+        self.config_snapshot = {key: json.dumps(value) for key, value in config.items()}
+        return config
+
+    def load_journal(self):
+        """
+        load_journal
+        args: self - self object
+        purpose: replay measurements journaled but not flushed before the last exit, skipping a torn last line
+        """
+        if os.path.exists(self.journal_file):
+            damaged = False
+            with open(self.journal_file, 'r') as file:
+                for line in file:
+                    try:
+                        self.journal_pending.append(json.loads(line))
+                    except ValueError:
+                        damaged = True
+                        Logger.info(f'database: skipping damaged journal line: {line!r}')
+            if damaged:
+                with open(self.journal_file, 'w') as file:
+                    file.write(''.join(json.dumps(entry) + '\n' for entry in self.journal_pending))
+                    file.flush()
+                    os.fsync(file.fileno())
+        if self.journal_pending:
+            Logger.info(f'database: replaying {len(self.journal_pending)} journaled measurements')
+            self.journal_sequence = self.journal_pending[-1]['id']
+            self.flush_journal()
+
+    def overlay_journal(self, rows, date, name=None, measurement_method=False):
+        """
+        overlay_journal
+        args: self - self object
+            rows - list of measurement rows from the metrics database
+            date - date string
+            name - optional name of measurement, None for every measurement of the date
+            measurement_method - optional measurement method, False for any method
+        purpose: apply journaled measurements that are not flushed yet to a measurement query result
+        returns: list of measurement rows sorted by sort key and name
+        """
+        pending = {}
+        for entry in self.journal_pending:
+            if entry['date'] == date and name in (None, entry['name']) and measurement_method in (False,
+                    entry['measure_method']):
+                pending[(entry['name'], entry['measure_method'])] = entry
+        if not pending:
+            return rows
+        rows = [row for row in rows if (row['name'], row['measure_method']) not in pending]
+        return sorted(rows + [{key: entry[key] for key in ('date', 'name', 'value', 'unit_type', 'measure_method',
+            'sort_key')} for entry in pending.values()], key=lambda row: (row['sort_key'], row['name']))
+
+    def quarantine_journal_entries(self, entries):
+        """
+        quarantine_journal_entries
+        args: self - self object
+            entries - list of journal entry or measurement dictionaries the metrics database rejects or prunes
+        purpose: durably set aside measurements that can never be stored, so they stop blocking and replaying the
+            journal, or that a migration removes, so no user data is dropped without a record
+        """
+        with open(self.journal_quarantine_file, 'a') as file:
+            file.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def queue_journal_write(self, entries):
+        """
+        queue_journal_write
+        args: self - self object
+            entries - list of journal entry dictionaries
+        purpose: have the database executor append entries to the journal, watching for the append to fail
+        """
+        future = self.executor.submit('write_journal', entries)
+        future.add_done_callback(functools.partial(self.journal_write_done, entries))
+
+    def retry_journal_write(self, entries, *kwargs):
+        """
+        retry_journal_write
+        args: self - self object
+            entries - list of journal entry dictionaries that could not be appended
+            kwargs - extra args from partial
+        purpose: retry appending the entries that are still not flushed to the metrics database
+        """
+        App.get_running_app().app_data_dict['unpickleable']['confirmation popup'].dismiss()
+        pending_ids = {entry['id'] for entry in self.journal_pending}
+        entries = [entry for entry in entries if entry['id'] in pending_ids]
+        if entries:
+            self.queue_journal_write(entries)
+
+    def schedule_config_store(self):
+        """
+        schedule_config_store
+        args: self - self object
+        purpose: store config once changes stop arriving for config_store_delay seconds, so dragging a slider results
+            in one transaction
+        """
+        if self.config_store_event:
+            self.config_store_event.cancel()
+        self.config_store_event = Clock.schedule_once(self.flush_config, self.config_store_delay)
+
+    def store_config(self, config):
+        """
+        store_config
+        args: self - self object
+            config - dictionary of configuration options
+        purpose: write the config keys that changed since they were last loaded or stored in one transaction, keys
+            that failed to commit stay changed so the next store writes them again
+        returns: list of keys written
+        """
+        changed = {key: json.dumps(value) for key, value in config.items()
+            if json.dumps(value) != self.config_snapshot.get(key)}
+        if changed and database_util.store_config(self.app_db, {key: config[key] for key in changed}):
+            self.config_snapshot.update(changed)
+            return list(changed)
+        return []
+
+    def store_journal_entries(self, entries):
+        """
+        store_journal_entries
+        args: self - self object
+            entries - list of journal entry dictionaries
+        purpose: write journaled measurements in one transaction, run on the database executor thread, entries the
+            database rejects for good are quarantined and the rest committed
+        returns: list of quarantined entries, None if the batch hit a transient error and should be retried
+        """
+        quarantined = []
+        try:
+            for entry in entries:
+                try:
+                    self.metrics_db.execute(self.statements['upsert measurement'], (entry['date'], entry['name'],
+                        entry['value'], entry['unit_type'], entry['measure_method'], entry['sort_key']))
+                except Exception as e:
+                    if self.is_transient_error(e):
+                        raise
+                    Logger.info(f'database: store_journal_entries: quarantining {entry!r}: {e}')
+                    quarantined.append(entry)
+            self.metrics_db.commit()
+        except Exception as e:
+            self.metrics_db.rollback()
+            Logger.info(f'database: store_journal_entries: {e}')
+            if self.is_transient_error(e):
+                return None
+            quarantined = entries
+        if quarantined:
+            try:
+                self.quarantine_journal_entries(quarantined)
+            except OSError as e:
+                Logger.info(f'database: store_journal_entries: quarantine failed: {e}')
+                return None
+        return quarantined
+
     def store_measurement(self, name, value, unit_type, measure_method, sort_key):
         """
         store_circumference_measurement
@@ -206,29 +680,58 @@ class Database:
             sort_key - sort key for grouping output
         purpose: store a measurement in database
         """
-        date_str = datetime.date.today().isoformat()
-        db_measurement = self.get_measurement(date_str, name)
-        if db_measurement:
-            sql = """
-                UPDATE measurements
-                SET value = ?,
-                    unit_type = ?
-                WHERE date = ? AND
-                    name = ? AND
-                    measure_method """
-            if measure_method is None:
-                sql += 'IS NULL'
-                database_util.basic_edit(self.metrics_db, sql, (value, unit_type, date_str, name))
+        self.store_measurements([(name, value, unit_type, measure_method, sort_key)])
+
+    def store_measurements(self, batch):
+        """
+        store_measurements
+        args: self - self object
+            batch - list of tuples of name, value, unit type, measure method and sort key
+        purpose: store a batch of measurements and refresh history once, the batch is acknowledged once it is
+            pending in the journal and written to the metrics database in one transaction behind it, history and the
+            datepicker are refreshed when that transaction commits
+        """
+        today = datetime.date.today()
+        if batch:
+            for name, value, unit_type, measure_method, sort_key in batch:
+                self.invalidate_measurement(today.isoformat(), name, measure_method)
+            if self.executor:
+                self.append_journal(today.isoformat(), batch)
             else:
-                sql += '= ?'
-                database_util.basic_edit(self.metrics_db, sql, (value, unit_type, date_str, name, measure_method))
-        else:
-            sql = """
-                INSERT INTO measurements
-                (date, name, value, unit_type, measure_method, sort_key)
-                VALUES(?, ?, ?, ?, ?, ?)
-            """
-            database_util.basic_edit(self.metrics_db, sql,
-                                     (date_str, name, value, unit_type, measure_method, sort_key))
-        app = App.get_running_app()
-        app.app_data_dict['unpickleable']['history'].update_today_label()
+                database_util.batch_edit(self.metrics_db, [(self.statements['upsert measurement'],
+                    (today.isoformat(), *measurement)) for measurement in batch])
+                self.invalidate_month_dates(today)
+                self.update_history(batch)
+
+    def truncate_journal(self):
+        """
+        truncate_journal
+        args: self - self object
+        purpose: empty the journal once every entry in it is stored, run on the database executor thread after the
+            appends it covers
+        """
+        open(self.journal_file, 'w').close()
+
+    def update_history(self, measurements):
+        """
+        update_history
+        args: self - self object
+            measurements - list of tuples of name, value, unit type, measure method and sort key
+        purpose: apply stored measurements to the history screen, which reads them from the database itself when it
+            has not been built yet
+        """
+        unpickleable = App.get_running_app().app_data_dict['unpickleable']
+        if 'history' in unpickleable and lazy_screen.is_built(unpickleable['history']):
+            unpickleable['history'].update_today_label(measurements)
+
+    def write_journal(self, entries):
+        """
+        write_journal
+        args: self - self object
+            entries - list of journal entry dictionaries
+        purpose: durably append entries to the journal, run on the database executor thread ahead of their flush
+        """
+        with open(self.journal_file, 'a') as file:
+            file.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+            file.flush()
+            os.fsync(file.fileno())
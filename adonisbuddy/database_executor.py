@@ -0,0 +1,82 @@
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import functools
+import queue
+import threading
+from concurrent.futures import Future
+from kivy.clock import Clock
+from kivy.logger import Logger
+# local imports
+import database
+
+class DatabaseExecutor:
+    """
+    DatabaseExecutor
+    purpose: run Database methods on a worker thread that owns its own connections, delivering results to the UI
+        thread through Clock so no frame waits on disk
+    """
+    database = None
+    request_queue = None
+    worker = None
+
+    def __init__(self):
+        """
+        __init__
+        args: self - self object
+        purpose: create an idle executor, the worker thread and its connections are started on first submit
+        """
+        self.request_queue = queue.Queue()
+
+    def submit(self, method_name, *args, callback=None):
+        """
+        submit
+        args: self - self object
+            method_name - name of Database method to run
+            args - arguments for the method
+            callback - optional method called on the UI thread with the result followed by Clock arguments
+        purpose: queue a Database call for the worker thread, calls run in submission order
+        returns: concurrent.futures.Future of the result
+        """
+        future = Future()
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.work, name='database', daemon=True)
+            self.worker.start()
+        self.request_queue.put((future, method_name, args, callback))
+        return future
+
+    def work(self):
+        """
+        work
+        args: self - self object
+        purpose: worker thread loop, opens the worker's connections and runs queued calls, if the connections cannot
+            be opened the call fails and the next call tries to open them again
+        """
+        while True:
+            future, method_name, args, callback = self.request_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if self.database is None:
+                    self.database = database.Database()
+                result = getattr(self.database, method_name)(*args)
+            except Exception as e:
+                Logger.info(f'database_executor: {method_name} failed: {e}')
+                future.set_exception(e)
+                continue
+            future.set_result(result)
+            if callback:
+                Clock.schedule_once(functools.partial(callback, result))
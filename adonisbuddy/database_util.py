@@ -16,12 +16,21 @@
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
 import functools
 import json
+import sqlite3
 from kivy.clock import Clock
 from kivy.logger import Logger
 from kivy.app import App
 
 __version__ = '1.0.0'
 
+config_defaults = {
+    'hardware keyboard': {'active': True},
+    'selection bubble': {'selection limit': 3},
+    'software keyboard': {'active': True},
+    'vibrate': {'active': True},
+    'volume': {'mute': False, 'percent': 100}
+}
+
 def basic_edit(db, sql, values, *kwargs):
     """
     basic_edit
@@ -52,40 +61,39 @@ def basic_query(db, query_str, values=None):
         query_str - query string
         values - optional tuple of values
     purpose: perform a basic query
-    returns: list of dictionaries containing results
+    returns: list of dictionaries containing results, or sqlite3.Row objects if the connection uses them
     """
-    curs = db.cursor()
-    if values:
-        res = curs.execute(query_str, values)
+    curs = db.execute(query_str, values) if values else db.execute(query_str)
+    if db.row_factory is sqlite3.Row:
+        results = curs.fetchall()
     else:
-        res = curs.execute(query_str)
-    raw_dict = dict_encode(curs)
+        results = dict_encode(curs)
     curs.close()
-    return raw_dict
-
-def conditional_config_insertion(db, key, json_val):
-    """
-    conditional_config_insertion
-    args: db - app database obj
-        key - config key
-        json_val - dictionary to convert into json for database storage
-    purpose: initialize a missing config element
-    """
-    sql = "INSERT INTO config (config_key, config_json) VALUES (?, ?)"
-    if not config_exists(db, key):
-        json_str = json.dumps(json_val)
-        basic_edit(db, sql, (key, json_str))
+    return results
 
-def config_exists(db, config_key):
+def batch_edit(db, edits, *kwargs):
     """
-    config_exists
-    args: db - app database object
-        config_key - config key to check for
-    purpose: return indicator of if config exists in config table
-    returns: boolean indicator of config option existence
+    batch_edit
+    args: db - database object
+        edits - list of tuples containing an SQL insert or update statement and its values
+        kwargs - extra arguments from partial
+    purpose: insert or update database with all edits in a single transaction
+    returns: boolean indicator as to if the edits were committed
     """
-    result = basic_query(db, 'SELECT * FROM config WHERE config_key = ?', values=(config_key,))
-    return bool(result)
+    try:
+        for sql, values in edits:
+            db.execute(sql, values)
+        db.commit()
+        return True
+    except Exception as e:
+        db.rollback()
+        app = App.get_running_app()
+        Logger.info(f'database: batch_edit: {str(e)}')
+        for sql, values in edits:
+            Logger.info(f'database: batch_edit: {str(sql)} {str(values)}')
+        app.app_data_dict['unpickleable']['confirmation popup'].open_confirm_popup('Database write failure. Retry?',
+            functools.partial(retry_batch_edit, db, edits), over_press_protected=True)
+        return False
 
 def create_config_table(curs):
     """
@@ -137,17 +145,26 @@ def get_config_table(db):
     """
     get_config_table
     args: db - app database object
-    purpose: retrieve application configuration
+    purpose: retrieve application configuration, seeding missing defaults in one transaction
     returns: dictionary of configuration options
     """
-    conditional_config_insertion(db, 'hardware keyboard', {"active": True})
-    conditional_config_insertion(db, 'selection bubble', {"selection limit": 3})
-    conditional_config_insertion(db, 'software keyboard', {"active": True})
-    conditional_config_insertion(db, 'vibrate', {"active": True})
-    conditional_config_insertion(db, 'volume', {'mute': False, 'percent': 100})
+    sql = 'INSERT OR IGNORE INTO config (config_key, config_json) VALUES (?, ?)'
+    batch_edit(db, [(sql, (key, json.dumps(json_val))) for key, json_val in config_defaults.items()])
     results = basic_query(db, 'SELECT * FROM config')
     return results
 
+def retry_batch_edit(db, edits, *kwargs):
+    """
+    retry_batch_edit
+    args: db - database object
+        edits - list of tuples containing an SQL insert or update statement and its values
+        kwargs - extra args from partial
+    purpose: retry a batch of inserts or updates to database
+    """
+    app = App.get_running_app()
+    app.app_data_dict['unpickleable']['confirmation popup'].dismiss()
+    Clock.schedule_once(functools.partial(batch_edit, db, edits), 2)
+
 def retry_edit(db, sql, values, *kwargs):
     """
     retry_edit
@@ -166,13 +183,10 @@ def store_config(db, config):
     store_config
     args: db - app database obj
         config - dictionary of configuration options
-    purpose: write config to disk
-    """
-    update_sql = 'UPDATE config SET config_json = ? WHERE config_key = ?'
-    insert_sql = 'INSERT INTO config (config_json, config_key) VALUES (?, ?)'
-    for config_key, dict_obj in config.items():
-        json_str = json.dumps(dict_obj)
-        if config_exists(db, config_key):
-            basic_edit(db, update_sql, (json_str, config_key))
-        else:
-            basic_edit(db, insert_sql, (json_str, config_key))
+    purpose: write config to disk in one transaction
+    returns: boolean indicator as to if the config was committed
+    """
+    sql = """
+        INSERT INTO config (config_key, config_json) VALUES (?, ?)
+        ON CONFLICT(config_key) DO UPDATE SET config_json = excluded.config_json"""
+    return batch_edit(db, [(sql, (config_key, json.dumps(dict_obj))) for config_key, dict_obj in config.items()])
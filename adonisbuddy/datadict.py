@@ -14,14 +14,18 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import json
 import os
 from collections import OrderedDict
-from kivy.core.image import Image as CoreImage
+from kivy.core.image import ImageLoader
 # local imports
 import database
-import database_util
+from database_executor import DatabaseExecutor
+from texture_cache import TextureCache
+from touch_mask import TouchMask
 
 class DataDict:
+    touch_mask_scale = 2
 
     def get_data_dict(self, data_dict):
         """
@@ -30,18 +34,21 @@ class DataDict:
             data_dictionary to populate
         purpose: create application data dictionary
         """
-        db = database.Database()
-        data_dict['config'] = database_util.get_config(db.app_db)
+        db = database.Database(executor=DatabaseExecutor())
+        data_dict['config'] = db.load_config()
         birth_date = db.get_birth_date()
         birth_date = birth_date[0]['value'] if birth_date else 'NOT SET'
         data_dict['global properties'] = {
             'birth date': birth_date,
             'last button press time': 0
         }
+        image_map = self.get_image_maps(db)
         data_dict['unpickleable'] = {
                 'database': db,
                 'data dictionary': self,
-                'image map': self.get_image_maps(db)
+                'image map': image_map,
+                'texture cache': TextureCache(),
+                'touch masks': self.get_touch_masks(image_map)
             }
 
     def get_image_maps(self, db):
@@ -52,15 +59,46 @@ class DataDict:
         purpose: retrieve the database
         """
         images_items = db.get_circumference_images()
+        highlight_regions = {}
+        if os.path.exists(os.path.join('images', 'highlights.atlas')):
+            with open(os.path.join('images', 'highlights.json'), 'r') as file:
+                highlight_regions = json.load(file)
         circumference_maps = OrderedDict()
         for image_map in images_items:
             if image_map['display']:
                 if image_map['body_part_name'] not in circumference_maps:
                     circumference_maps[image_map['body_part_name']] = {}
                 circumference_maps[image_map['body_part_name']][image_map['screen']] = {
-                    'core image': CoreImage(os.path.join('images', image_map['touch_image']), keep_data=True),
                     'display image file': image_map['selected_image'],
+                    'highlight region': highlight_regions.get(image_map['selected_image']),
                     'selected': False,
                     'touch image file': image_map['touch_image']
                 }
         return circumference_maps
+
+    def get_touch_masks(self, image_maps):
+        """
+        get_touch_masks
+        args: self - self object
+            image_maps - image map dictionary from get_image_maps
+        purpose: load the touch mask of each screen from cache, rebuilding it from the touch images if stale
+        returns: dictionary of TouchMask objects keyed by screen name
+        """
+        touch_images = {}
+        for name, screens in image_maps.items():
+            for screen, image_map in screens.items():
+                if screen not in touch_images:
+                    touch_images[screen] = []
+                touch_images[screen].append((name, os.path.join('images', image_map['touch image file'])))
+        if not os.path.exists('touch_masks'):
+            os.makedirs('touch_masks')
+        touch_masks = {}
+        for screen, images in touch_images.items():
+            mask_file = os.path.join('touch_masks', f'{screen}.mask')
+            sources = [[name, path, os.stat(path).st_size, os.stat(path).st_mtime_ns] for name, path in images]
+            touch_mask = touch_masks[screen] = TouchMask()
+            if not touch_mask.load(mask_file, sources, self.touch_mask_scale):
+                touch_mask.build(((name, ImageLoader.load(path, keep_data=True)._data[0]) for name, path in images),
+                    scale=self.touch_mask_scale)
+                touch_mask.save(mask_file, sources)
+        return touch_masks
@@ -14,6 +14,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
+import functools
 from kivy.app import App
 from kivy.logger import Logger
 from kivymd.uix.label import MDLabel
@@ -24,6 +25,7 @@ import over_press
 __version__ = '1.0.0'
 
 class DatePicker(MDDatePicker):
+    calendar_shown = None
     get_color_dates_by_year_month = None
 
     def __init__(self, year=None, month=None, day=None, firstweekday=0, color_picker_func=None, **kwargs,):
@@ -53,6 +55,29 @@ class DatePicker(MDDatePicker):
         if over_press.protect(vibrate=True):
             super().change_month(operation)
 
+    def color_dates(self, year, month, workout_dates, *kwargs):
+        """
+        color_dates
+        args: self - self object
+            year - year of workout dates
+            month - month of workout dates
+            workout_dates - list of dictionaries of ISO format date strings
+            kwargs - extra arguments from Clock
+        purpose: color the days with workout data if the calendar still shows their month
+        """
+        if self.calendar_shown != (year, month):
+            return
+        color_days = [int(row['date'][-2:]) for row in workout_dates]
+        for day_widget in self._calendar_list:
+            for label in day_widget.children:
+                if isinstance(label, MDLabel):
+                    if day_widget.text.isdigit() and int(day_widget.text) in color_days:
+                        label.text_color = (1, 1, 0, 1)
+                        label.bold = True
+                    else:
+                        label.text_color = (1, 1, 1, 1)
+                        label.bold = False
+
     def set_selected_widget(self, widget):
         """
         set_selected_widget
@@ -90,22 +115,15 @@ class DatePicker(MDDatePicker):
         args: self - self object
             year - year of datepicker calendar
             month - month of datepicker calendar
-        purpose: override update_calendar to change color of dates in datepicker for days with workout data
+        purpose: override update_calendar to change color of dates in datepicker for days with workout data, dates
+            from the database are colored when the database executor delivers them
         """
         Logger.info(f'date_picker: update_calendar {year} {month}')
         super().update_calendar(year, month)
-        if not self.get_color_dates_by_year_month:
+        self.calendar_shown = (year, month)
+        if self.get_color_dates_by_year_month:
+            self.color_dates(year, month, self.get_color_dates_by_year_month(year, month))
+        else:
             app = App.get_running_app()
-            self.get_color_dates_by_year_month = (
-                app.app_data_dict['unpickleable']['database'].get_color_dates_by_year_month)
-        workout_dates = self.get_color_dates_by_year_month(year, month)
-        color_days = [int(row['date'][-2:]) for row in workout_dates]
-        for day_widget in self._calendar_list:
-            for label in day_widget.children:
-                if isinstance(label, MDLabel):
-                    if day_widget.text.isdigit() and int(day_widget.text) in color_days:
-                        label.text_color = (1, 1, 0, 1)
-                        label.bold = True
-                    else:
-                        label.text_color = (1, 1, 1, 1)
-                        label.bold = False
+            app.app_data_dict['unpickleable']['database'].executor.submit('get_color_dates_by_year_month', year, month,
+                callback=functools.partial(self.color_dates, year, month))
@@ -0,0 +1,168 @@
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import glob
+import json
+import os
+import weakref
+from kivy.app import App
+from kivy.logger import Logger
+
+__version__ = '1.0.0'
+
+cache_file = 'display_geometry.json'
+scale_file = 'scale.kv'
+
+def bind_window_height(widget, property_name, divisor, app=None):
+    """
+    bind_window_height
+    args: widget - widget object
+        property_name - name of widget size property
+        divisor - window height divisor for the property value
+        app - optional app object
+    purpose: size a widget property from the window height and keep it sized when the window is resized, the
+        binding holds the widget weakly and unbinds itself once the widget is gone so recreated widgets do not leak
+    returns: widget object
+    """
+    app = app if app else App.get_running_app()
+    widget_ref = weakref.ref(widget)
+
+    def resize(instance, value):
+        """
+        resize
+        args: instance - app object
+            value - new window height
+        purpose: resize the widget property, or unbind once the widget has been garbage collected
+        """
+        bound_widget = widget_ref()
+        if bound_widget is None:
+            app.unbind(window_height=resize)
+        else:
+            setattr(bound_widget, property_name, value // divisor)
+
+    setattr(widget, property_name, app.window_height // divisor)
+    app.bind(window_height=resize)
+    return widget
+
+def get_cached_size(identity):
+    """
+    get_cached_size
+    args: identity - display identity string
+    purpose: look up the screen size probed earlier for a display
+    returns: tuple of screen width and height, None if the display has not been probed
+    """
+    size = load_cache().get(identity)
+    return tuple(size) if size else None
+
+def get_display_identity():
+    """
+    get_display_identity
+    purpose: build a cheap identity for the attached display from the display server variables and, on Linux, the
+        connected DRM connectors and their preferred modes, so docking or swapping a display invalidates the cache
+    returns: display identity string
+    """
+    parts = [os.environ.get('WAYLAND_DISPLAY', ''), os.environ.get('DISPLAY', '')]
+    for status_path in sorted(glob.glob('/sys/class/drm/card*-*/status')):
+        try:
+            with open(status_path, 'r') as file:
+                if file.read().strip() != 'connected':
+                    continue
+            with open(os.path.join(os.path.dirname(status_path), 'modes'), 'r') as file:
+                mode = file.readline().strip()
+        except OSError:
+            continue
+        parts.append(f'{os.path.basename(os.path.dirname(status_path))}={mode}')
+    return ' '.join(parts)
+
+def get_screen_size():
+    """
+    get_screen_size
+    purpose: get the desktop screen size from cache, only importing tkinter to probe a display not seen before
+    returns: tuple of screen width and height
+    """
+    identity = get_display_identity()
+    size = get_cached_size(identity)
+    if not size:
+        size = probe_screen_size()
+        Logger.info(f'display_geometry: probed {size} for display "{identity}"')
+        store_size(identity, *size)
+    return size
+
+def load_cache():
+    """
+    load_cache
+    purpose: read the display geometry cache file
+    returns: dictionary of display identity to list of screen width and height
+    """
+    try:
+        with open(cache_file, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def probe_screen_size():
+    """
+    probe_screen_size
+    purpose: use tkinter to find screen size to fix Kivy screen scale issues
+    returns: tuple of screen width and height
+    """
+    from tkinter import Tk
+    root = Tk()
+    width = root.winfo_screenwidth()
+    height = root.winfo_screenheight()
+    root.destroy()
+    return width, height
+
+def read_scale():
+    """
+    read_scale
+    purpose: read the window size stored in scale.kv
+    returns: tuple of window width and height, None if scale.kv does not exist
+    """
+    if not os.path.exists(scale_file):
+        return None
+    with open(scale_file, 'r') as file:
+        line = file.readlines()
+    return int(line[0].split()[2]), int(line[1].split()[2])
+
+def store_size(identity, width, height):
+    """
+    store_size
+    args: identity - display identity string
+        width - screen width
+        height - screen height
+    purpose: record the screen size of a display in the geometry cache
+    """
+    cache = load_cache()
+    if cache.get(identity) != [width, height]:
+        cache[identity] = [width, height]
+        with open(cache_file + '.tmp', 'w') as file:
+            json.dump(cache, file)
+        os.replace(cache_file + '.tmp', cache_file)
+
+def write_scale(width, height):
+    """
+    write_scale
+    args: width - window width
+        height - window height
+    purpose: write the window size into scale.kv for the kv files, skipping the write when it is unchanged
+    returns: boolean indicator as to if scale.kv changed
+    """
+    if read_scale() == (width, height):
+        return False
+    with open(scale_file, 'w') as file:
+        file.write(f'#:set window_width {width}\n#:set window_height {height}\n')
+    return True
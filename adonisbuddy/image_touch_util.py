@@ -17,11 +17,108 @@
 
 import os
 from kivy.app import App
+from kivy.atlas import Atlas
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
 from kivy.logger import Logger
 #local imports
 import over_press
 
 class ImageTouchUtil:
+    base_image_file = ''
+    highlight = None
+    highlight_bound = False
+    highlight_color = (1, 1, 0, 0.5)
+    highlight_textures = None
+    overlay_highlight = True
+
+    def clear_highlight(self):
+        """
+        clear_highlight
+        args: self - self object
+        purpose: remove the highlight overlay from the selector image
+        """
+        self.highlight = None
+        self.ids['select_image_id'].canvas.after.clear()
+
+    def draw_highlight(self, *kwargs):
+        """
+        draw_highlight
+        args: self - self object
+            kwargs - optional arguments so it can be bound to widget properties
+        purpose: draw the highlight sprite over its region of the displayed base image
+        """
+        image = self.ids['select_image_id']
+        image.canvas.after.clear()
+        if self.highlight and self.highlight[0] and image.texture:
+            texture, x, y, width, height, pixel_scale, color = self.highlight
+            scale = image.norm_image_size[0] / image.texture_size[0] * pixel_scale
+            left = image.center_x - image.norm_image_size[0] / 2
+            bottom = image.center_y - image.norm_image_size[1] / 2
+            with image.canvas.after:
+                Color(*color)
+                Rectangle(texture=texture,
+                    pos=(left + x * scale, bottom + image.norm_image_size[1] - (y + height) * scale),
+                    size=(width * scale, height * scale))
+
+    def get_atlas_highlight(self, name, app=None):
+        """
+        get_atlas_highlight
+        args: self - self object
+            name - name of muscle
+            app - optional app object
+        purpose: find a muscle's cropped highlight sprite in the highlight atlas built by tools/build_atlas.py
+        returns: tuple of atlas texture, or None if the selected image matches the base image, and its region in
+            base image pixels, None if no atlas region exists for the muscle
+        """
+        app = app if app else App.get_running_app()
+        unpickleable = app.app_data_dict['unpickleable']
+        region = unpickleable['image map'][name][self.screen_name]['highlight region']
+        if not region:
+            return None
+        texture = None
+        if region['id']:
+            if 'highlight atlas' not in unpickleable:
+                unpickleable['highlight atlas'] = Atlas(os.path.join('images', 'highlights.atlas'))
+            texture = unpickleable['highlight atlas'][region['id']]
+        return texture, region['x'], region['y'], region['width'], region['height'], 1, (1, 1, 1, 1)
+
+    def get_highlight_texture(self, touch_mask, name):
+        """
+        get_highlight_texture
+        args: self - self object
+            touch_mask - TouchMask of this screen
+            name - name of muscle
+        purpose: build, or reuse, the small tintable overlay texture of a muscle's touch region
+        returns: tuple of texture and its region in mask pixels, None if the muscle has no touch region
+        """
+        if self.highlight_textures is None:
+            self.highlight_textures = {}
+        if name not in self.highlight_textures:
+            highlight = touch_mask.get_highlight(name)
+            if highlight:
+                x, y, width, height, pixels = highlight
+                texture = Texture.create(size=(width, height), colorfmt='luminance_alpha')
+                texture.blit_buffer(pixels, colorfmt='luminance_alpha', bufferfmt='ubyte')
+                highlight = (texture, x, y, width, height, touch_mask.scale, self.highlight_color)
+            self.highlight_textures[name] = highlight
+        return self.highlight_textures[name]
+
+    def preload_images(self, *kwargs):
+        """
+        preload_images
+        args: self - self object
+            kwargs - optional arguments so it can be called from Clock
+        purpose: queue this screen's base image, and selected images if overlays are off, for background decoding
+        """
+        app = App.get_running_app()
+        unpickleable = app.app_data_dict['unpickleable']
+        paths = [os.path.join('images', self.base_image_file)]
+        if not self.overlay_highlight:
+            for muscle in unpickleable['image map'].values():
+                if self.screen_name in muscle:
+                    paths.append(os.path.join('images', muscle[self.screen_name]['display image file']))
+        unpickleable['texture cache'].preload(paths)
 
     def select_image(self, name):
         """
@@ -30,9 +127,47 @@ class ImageTouchUtil:
             name - name of muscle
         purpose: set form for selected image
         """
-        app = App.get_running_app()
-        self.ids['select_image_id'].source = os.path.join('images',
-            app.app_data_dict['unpickleable']['image map'][name][self.screen_name]['display image file'])
+        self.show_selection(name)
+
+    def show_selection(self, name, app=None):
+        """
+        show_selection
+        args: self - self object
+            name - name of muscle
+            app - optional app object
+        purpose: overlay a muscle's atlas sprite, or else its tinted touch region, on the base image, falling back to
+            the muscle's selected image file
+        """
+        app = app if app else App.get_running_app()
+        unpickleable = app.app_data_dict['unpickleable']
+        highlight = None
+        if self.overlay_highlight:
+            highlight = self.get_atlas_highlight(name, app=app)
+            if not highlight and self.screen_name in unpickleable['touch masks']:
+                highlight = self.get_highlight_texture(unpickleable['touch masks'][self.screen_name], name)
+        if highlight:
+            self.show_image(self.base_image_file, app=app)
+            if not self.highlight_bound:
+                self.ids['select_image_id'].bind(pos=self.draw_highlight, size=self.draw_highlight,
+                    texture=self.draw_highlight)
+                self.highlight_bound = True
+            self.highlight = highlight
+            self.draw_highlight()
+        else:
+            self.clear_highlight()
+            self.show_image(unpickleable['image map'][name][self.screen_name]['display image file'], app=app)
+
+    def show_image(self, image_file, app=None):
+        """
+        show_image
+        args: self - self object
+            image_file - file name of image in the images directory
+            app - optional app object
+        purpose: display an image from the texture cache on the selector image
+        """
+        app = app if app else App.get_running_app()
+        self.ids['select_image_id'].texture = app.app_data_dict['unpickleable']['texture cache'].get(
+            os.path.join('images', image_file))
 
     def touched(self, image, touch):
         """
@@ -54,9 +189,10 @@ class ImageTouchUtil:
                     x_coord = (touch.x - x_padding) / scale
                     y_coord = image.texture_size[1] - (touch.y / scale)
                     if 0 <= x_coord < image.texture_size[0] and 0 <= y_coord < image.texture_size[1]:
-                        for name, muscle in app.app_data_dict['unpickleable']['image map'].items():
+                        unpickleable = app.app_data_dict['unpickleable']
+                        touched_name = unpickleable['touch masks'][self.screen_name].lookup(x_coord, y_coord)
+                        for name, muscle in unpickleable['image map'].items():
                             if self.screen_name in muscle:
-                                color = muscle[self.screen_name]['core image'].read_pixel(x_coord, y_coord)
-                                muscle[self.screen_name]['selected'] = True if color[3] else False
-                                if muscle[self.screen_name]['selected']:
-                                    self.select_image(name)
+                                muscle[self.screen_name]['selected'] = name == touched_name
+                        if touched_name:
+                            self.select_image(touched_name)
@@ -0,0 +1,95 @@
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+from kivy.app import App
+from kivy.logger import Logger
+
+class LazyScreen:
+    """
+    LazyScreen
+    purpose: stand-in for a screen in the unpickleable data dictionary that builds the screen on first use
+    """
+    navigation_key = ''
+
+    def __init__(self, navigation_key):
+        """
+        __init__
+        args: self - self object
+            navigation_key - key of screen in the app navigation map
+        purpose: remember which navigation map entry to build on demand
+        """
+        self.navigation_key = navigation_key
+
+    def __getattr__(self, name):
+        """
+        __getattr__
+        args: self - self object
+            name - attribute name
+        purpose: build the screen and forward attribute access to it
+        returns: attribute of built screen
+        """
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def materialize(self, app=None):
+        """
+        materialize
+        args: self - self object
+            app - optional app object
+        purpose: build the screen, or get it if it was already built
+        returns: screen object
+        """
+        app = app if app else App.get_running_app()
+        return get_screen(self.navigation_key, app=app)
+
+def get_screen(navigation_key, app=None):
+    """
+    get_screen
+    args: navigation_key - key of screen in the app navigation map
+        app - optional app object
+    purpose: build a navigation map screen with its factory on first use and cache it in the navigation map and the
+        unpickleable data dictionary
+    returns: screen object
+    """
+    app = app if app else App.get_running_app()
+    selected = app.navigation_map[navigation_key]
+    if selected['screen'] is None:
+        Logger.info(f'lazy_screen: get_screen: building {navigation_key}')
+        selected['screen'] = selected['factory']()
+        app.app_data_dict['unpickleable'][selected['unpickleable key']] = selected['screen']
+    return selected['screen']
+
+def install_proxies(app=None):
+    """
+    install_proxies
+    args: app - optional app object
+    purpose: put a proxy in the unpickleable data dictionary for every navigation map screen not built yet
+    """
+    app = app if app else App.get_running_app()
+    unpickleable = app.app_data_dict['unpickleable']
+    for navigation_key, selected in app.navigation_map.items():
+        if selected['screen'] is None:
+            unpickleable[selected['unpickleable key']] = LazyScreen(navigation_key)
+
+def is_built(screen):
+    """
+    is_built
+    args: screen - screen object or proxy from the unpickleable data dictionary
+    purpose: tell whether a screen has been built, so updates that a screen reads at build time can skip it
+    returns: boolean
+    """
+    return not isinstance(screen, LazyScreen)
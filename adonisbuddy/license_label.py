@@ -14,7 +14,9 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with Muscle Buddy.  If not, see <https://www.gnu.org/licenses/>.
+from kivy.properties import NumericProperty, StringProperty
 from kivy.uix.label import Label
 
 class LicenseLabel(Label):
-    pass
+    chunk_height = NumericProperty(0)
+    chunk_text = StringProperty('')
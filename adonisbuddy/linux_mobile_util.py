@@ -14,30 +14,92 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
+import functools
 import os
 import shutil
 import subprocess
+import threading
+from kivy.clock import Clock
 from kivy.core.window import Window
+from kivy.logger import Logger
 from kivy.utils import platform
 
 __version__ = '1.0.0'
 
-if platform == 'linux':
-    import psutil
+session_environment = None
+squeekboard_callbacks = []
+squeekboard_lock = threading.Lock()
+squeekboard_state = None
+squeekboard_timeout = 2
+squeekboard_worker = None
 
-def disable_squeekboard():
+def apply_squeekboard(enabled):
+    """
+    apply_squeekboard
+    args: enabled - boolean indicator as to if the squeekboard icon is to be enabled or disabled
+    purpose: write the squeekboard setting, called from the squeekboard worker thread
+    returns: boolean indicator as to if the setting was written
+    """
+    if not get_session_environment()['squeekboard']:
+        return False
+    try: # most efficient solution using PyGObject
+        from gi.repository import Gio, GLib
+        gso=Gio.Settings.new('org.gnome.desktop.a11y.applications')
+        gso.set_value('screen-keyboard-enabled', GLib.Variant('b', enabled))
+        Gio.Settings.sync()
+        return True
+    except Exception as e: # dirty hack if PyGObject does not work
+        try:
+            subprocess.run([shutil.which('gsettings'), 'set', 'org.gnome.desktop.a11y.applications',
+                'screen-keyboard-enabled', str(enabled).lower()], start_new_session=True, timeout=squeekboard_timeout,
+                check=True)
+            return True
+        except Exception as e:
+            Logger.info(f'linux_mobile_util: apply_squeekboard failed: {e}')
+            return False
+
+def disable_squeekboard(callback=None):
     """
     disable_squeekboard
+    args: callback - optional method called on the UI thread with the applied state and success indicator
     purpose: disable squeekboard
     """
-    set_squeekboard(False)
+    set_squeekboard(False, callback=callback)
 
-def enable_squeekboard():
+def enable_squeekboard(callback=None):
     """
     enable_squeekboard
+    args: callback - optional method called on the UI thread with the applied state and success indicator
     purpose: enabel squeekboard
     """
-    set_squeekboard(True)
+    set_squeekboard(True, callback=callback)
+
+def get_session_environment():
+    """
+    get_session_environment
+    purpose: probe once whether the session runs the phosh shell and the squeekboard keyboard, using the desktop
+        environment variable and one pass over the process names in /proc
+    returns: dictionary of process name to boolean indicator as to if it is running
+    """
+    global session_environment
+    if session_environment is None:
+        environment = {'phosh': False, 'squeekboard': False}
+        if platform == 'linux':
+            if 'phosh' in os.environ.get('XDG_CURRENT_DESKTOP', '').lower().split(':'):
+                environment['phosh'] = True
+            for pid in os.listdir('/proc'):
+                if all(environment.values()):
+                    break
+                if pid.isdigit():
+                    try:
+                        with open(os.path.join('/proc', pid, 'comm'), 'r') as file:
+                            name = file.read().strip()
+                    except OSError:
+                        continue
+                    if name in environment:
+                        environment[name] = True
+        session_environment = environment
+    return session_environment
 
 def set_mobile_fullscreen():
     """
@@ -48,17 +110,56 @@ def set_mobile_fullscreen():
         Window.maximize()
         Window.fullscreen = True
 
-def set_squeekboard(enabled):
+def set_squeekboard(enabled, callback=None):
     """
     set_squeekboard
     args: enabled - boolean indicator as to if the squeekboard icon is to be enabled or disabled
-    purpose: remove the manual icon button for keyboard to fix touch screen conflicts
-    """
-    if platform == 'linux' and any(process.name() == 'squeekboard' for process in psutil.process_iter()):
-        try: # most efficient solution using PyGObject
-            from gi.repository import Gio, GLib
-            gso=Gio.Settings.new('org.gnome.desktop.a11y.applications')
-            gso.set_value('screen-keyboard-enabled', GLib.Variant('b', enabled))
-        except Exception as e: # dirty hack if PyGObject does not work
-            subprocess.Popen([shutil.which('gsettings'), 'set', 'org.gnome.desktop.a11y.applications',
-                'screen-keyboard-enabled', str(enabled).lower()], start_new_session=True)
+        callback - optional method called on the UI thread with the applied state and success indicator
+    purpose: remove the manual icon button for keyboard to fix touch screen conflicts, the setting is written by a
+        worker thread so the caller never waits on GSettings, and toggles requested while a write is running coalesce
+        into one write of the latest state
+    """
+    global squeekboard_state, squeekboard_worker
+    if platform != 'linux':
+        return
+    with squeekboard_lock:
+        squeekboard_state = enabled
+        if callback:
+            squeekboard_callbacks.append(callback)
+        if squeekboard_worker is None:
+            # a daemon so a hung GSettings call cannot block exit, on_stop waits for it with wait_squeekboard
+            squeekboard_worker = threading.Thread(target=squeekboard_work, name='squeekboard', daemon=True)
+            squeekboard_worker.start()
+
+def squeekboard_work():
+    """
+    squeekboard_work
+    purpose: squeekboard worker thread loop, writes the latest requested state until no request is pending
+    """
+    global squeekboard_callbacks, squeekboard_state, squeekboard_worker
+    while True:
+        with squeekboard_lock:
+            if squeekboard_state is None:
+                squeekboard_worker = None
+                return
+            enabled = squeekboard_state
+            callbacks = squeekboard_callbacks
+            squeekboard_state = None
+            squeekboard_callbacks = []
+        success = apply_squeekboard(enabled)
+        for callback in callbacks:
+            Clock.schedule_once(functools.partial(callback, enabled, success))
+
+def wait_squeekboard(timeout=None):
+    """
+    wait_squeekboard
+    args: timeout - optional seconds to wait, defaults to a little over the gsettings timeout
+    purpose: give pending squeekboard writes a bounded time to land before the app exits
+    returns: boolean indicator as to if every requested write finished
+    """
+    with squeekboard_lock:
+        worker = squeekboard_worker
+    if worker:
+        worker.join(squeekboard_timeout + 1 if timeout is None else timeout)
+        return not worker.is_alive()
+    return True
@@ -23,6 +23,7 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDIconButton
 from kivymd.uix.gridlayout import MDGridLayout
 # local imports
+import display_geometry
 import hard_keyboard
 import over_press
 import soft_keyboard
@@ -103,10 +104,11 @@ class Config(MDBoxLayout):
         app = App.get_running_app()
         on = app.app_data_dict['config'][button_key]['active']
         unpickleable = app.app_data_dict['unpickleable']
-        button = unpickleable[f'{button_key} button'] = MDIconButton(icon=self.toggle_map[button_key]['icon'][int(on)],
-            icon_size=app.app_data_dict['window height'] // 19, on_release=unpickleable[f'{button_key} toggle method'])
-        label = unpickleable[f'{button_key} label'] = Label(font_size=app.app_data_dict['window height'] // 40,
-            halign='center', text=self.toggle_map[button_key]['text'][int(on)])
+        button = unpickleable[f'{button_key} button'] = display_geometry.bind_window_height(MDIconButton(
+            icon=self.toggle_map[button_key]['icon'][int(on)], on_release=unpickleable[f'{button_key} toggle method']),
+            'icon_size', 19, app=app)
+        label = unpickleable[f'{button_key} label'] = display_geometry.bind_window_height(Label(halign='center',
+            text=self.toggle_map[button_key]['text'][int(on)]), 'font_size', 40, app=app)
         box_layout = MDBoxLayout(orientation='horizontal')
         box_layout.add_widget(Widget())
         box_layout.add_widget(button)
@@ -145,6 +147,7 @@ class Config(MDBoxLayout):
         app = App.get_running_app()
         selection_limit = int(self.ids['selector_bubble_limit_id'].value)
         app.app_data_dict['config']['selection bubble']['selection limit'] = selection_limit
+        app.app_data_dict['unpickleable']['database'].schedule_config_store()
         self.ids['select_bubble_label_id'].text = f'selector size: {selection_limit}'
 
     def set_config_gui(self, on, key, app = None):
@@ -160,6 +163,7 @@ class Config(MDBoxLayout):
         self.ids[mapping['button id']].icon = mapping['icon'][int(on)]
         self.ids[mapping['label id']].text = mapping['text'][int(on)]
         app.app_data_dict['config'][key]['active'] = on
+        app.app_data_dict['unpickleable']['database'].schedule_config_store()
 
     def set_volume_icon(self):
         """
@@ -219,6 +223,7 @@ class Config(MDBoxLayout):
                 self.ids['volume_mute_button_id'].icon = self.sound_mute_icon
                 app.app_data_dict['config']['volume']['mute'] = True
             app.app_data_dict['unpickleable']['sound'].set_all_volumes()
+            app.app_data_dict['unpickleable']['database'].schedule_config_store()
 
     def toggle_py_button(self, key):
         """
@@ -234,6 +239,7 @@ class Config(MDBoxLayout):
             on = app.app_data_dict['config'][key]['active'] = (button.icon == mapping['icon'][0])
             button.icon = mapping['icon'][int(on)]
             app.app_data_dict['unpickleable'][f'{key} label'].text = mapping['text'][int(on)]
+            app.app_data_dict['unpickleable']['database'].schedule_config_store()
 
     def volume_slider_touched(self):
         """
@@ -245,6 +251,7 @@ class Config(MDBoxLayout):
         self.set_volume_icon()
         app.app_data_dict['config']['volume']['percent'] = self.ids['volume_slider_id'].value
         app.app_data_dict['unpickleable']['sound'].set_all_volumes()
+        app.app_data_dict['unpickleable']['database'].schedule_config_store()
 
     def toggle_vibrate(self, *kwargs):
         """
@@ -15,68 +15,66 @@
 # You should have received a copy of the GNU General Public License
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
+import functools
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.uix.label import Label
 from kivymd.uix.boxlayout import MDBoxLayout
+# local imports
+import display_geometry
 
 class MeasurementHistory(MDBoxLayout):
+    all_dates_loaded = False
+    date_page_size = 32
+    date_texts = None
+    dates = None
+    loading_dates = False
+    pending_dates = None
+    position = 0
+    rendering = False
+    today_date = None
+    today_rows = None
 
     def __init__(self):
         """
         __init__
         args: self - self object
-        purpose: initialize measurement history
+        purpose: initialize measurement history with only the newest page of dates, slides are rendered on demand
+            as query results arrive from the database executor
         """
         super().__init__()
-        app = App.get_running_app()
-        measurements = app.app_data_dict['unpickleable']['database'].get_measurements()
-        date_str = ''
-        label = None
-        key = -1
-        for measurement in measurements:
-            if measurement['date'] != date_str:
-                if label:
-                    self.ids['measurements_carousel'].add_widget(label)
-                date_str = measurement['date']
-                label = Label(font_size=app.app_data_dict['window height'] // 30, markup=True)
-                label.text = f'{date_str}\n'
-            if measurement['name'] == 'birth date':
-                continue
-            if key != -1 and key != int(measurement['sort_key']):
-                label.text += '\n'
-            key = int(measurement['sort_key'])
-            label.text += self.gen_label_row(measurement['name'], measurement['value'], measurement['unit_type'],
-                    measurement['measure_method'])
-        if label:
-            self.ids['measurements_carousel'].add_widget(label)
-
-    def update_today_label(self):
+        self.date_texts = {}
+        self.dates = []
+        self.pending_dates = set()
+        self.ids['measurements_carousel'].bind(index=self.on_carousel_index)
+        self.load_more_dates()
+
+    def dates_loaded(self, rows, *kwargs):
         """
-        update_today_label
+        dates_loaded
         args: self - self object
-        purpose: generate label text for today's carousel label
+            rows - page of measurement date rows, newest first
+            kwargs - extra arguments from Clock
+        purpose: append a page of older dates and render them
+        """
+        self.loading_dates = False
+        self.dates.extend(row['date'] for row in rows if not self.dates or row['date'] < self.dates[-1])
+        self.all_dates_loaded = len(rows) < self.date_page_size
+        self.render_window()
+
+    def gen_date_text(self, date_str, measurements):
+        """
+        gen_date_text
+        args: self - self object
+            date_str - ISO format date string
+            measurements - list of measurements for date sorted by sort key
+        purpose: generate label text for a day of measurements
         returns: string for label
         """
-        app = App.get_running_app()
-        today = datetime.date.today().isoformat()
-        measurements = app.app_data_dict['unpickleable']['database'].get_measurements_by_date(today)
-        if measurements:
-            if (self.ids['measurements_carousel'].slides and
-                    self.ids['measurements_carousel'].slides[0].text.startswith(today)):
-                label = self.ids['measurements_carousel'].slides[0]
-            else:
-                label = Label(font_size=app.app_data_dict['window height'] // 30, markup=True)
-                self.ids['measurements_carousel'].add_widget(label, index=-1)
-            label.text = f'{today}\n'
-            key = -1
-            for measurement in measurements:
-                if measurement['name'] == 'birth date':
-                    continue
-                if key != -1 and key != int(measurement['sort_key']):
-                    label.text += '\n'
-                key = int(measurement['sort_key'])
-                label.text += self.gen_label_row(measurement['name'], measurement['value'], measurement['unit_type'],
-                    measurement['measure_method'])
+        return self.join_label_rows(date_str, [(measurement['sort_key'], self.gen_label_row(measurement['name'],
+            measurement['value'], measurement['unit_type'], measurement['measure_method']))
+            for measurement in measurements if measurement['name'] != 'birth date'])
 
     def gen_label_row(self, name, value, unit_type, measure_method):
         """
@@ -102,3 +100,210 @@ class MeasurementHistory(MDBoxLayout):
         text = f"{name}: {value} {unit_type}"
         text += f" by {measure_method}\n" if measure_method else '\n'
         return text
+
+    def get_date_text(self, date_str):
+        """
+        get_date_text
+        args: self - self object
+            date_str - ISO format date string
+        purpose: retrieve label text for a date, requesting its measurements if it is not materialized
+        returns: string for label, only the date until the measurements arrive
+        """
+        if date_str == self.today_date:
+            self.date_texts[date_str] = self.join_label_rows(date_str,
+                [(sort_key, row) for sort_key, name, row in sorted(self.today_rows.values())])
+        elif date_str not in self.date_texts:
+            if date_str not in self.pending_dates:
+                self.pending_dates.add(date_str)
+                app = App.get_running_app()
+                future = app.app_data_dict['unpickleable']['database'].executor.submit('get_measurements_by_date',
+                    date_str, callback=functools.partial(self.measurements_loaded, date_str))
+                future.add_done_callback(functools.partial(self.query_done, date_str))
+            return self.join_label_rows(date_str, [])
+        return self.date_texts[date_str]
+
+    def get_window(self):
+        """
+        get_window
+        args: self - self object
+        purpose: find the dates rendered into the carousel, the current date and its neighbours
+        returns: list of ISO format date strings
+        """
+        return self.dates[max(0, self.position - 1):self.position + 2]
+
+    def join_label_rows(self, date_str, rows):
+        """
+        join_label_rows
+        args: self - self object
+            date_str - ISO format date string
+            rows - list of sort key and label line tuples sorted by sort key
+        purpose: join label lines into label text, grouping lines by whole sort key
+        returns: string for label
+        """
+        lines = [f'{date_str}\n']
+        key = -1
+        for sort_key, row in rows:
+            if key != -1 and key != int(sort_key):
+                lines.append('\n')
+            key = int(sort_key)
+            lines.append(row)
+        return ''.join(lines)
+
+    def load_more_dates(self):
+        """
+        load_more_dates
+        args: self - self object
+        purpose: request the next set of older measurement dates from database
+        """
+        if not self.loading_dates:
+            self.loading_dates = True
+            app = App.get_running_app()
+            future = app.app_data_dict['unpickleable']['database'].executor.submit('get_measurement_dates',
+                self.date_page_size, (self.dates[-1] if self.dates else None), callback=self.dates_loaded)
+            future.add_done_callback(functools.partial(self.query_done, None))
+
+    def measurements_loaded(self, date_str, measurements, *kwargs):
+        """
+        measurements_loaded
+        args: self - self object
+            date_str - ISO format date string
+            measurements - list of measurements for date sorted by sort key
+            kwargs - extra arguments from Clock
+        purpose: render a date's measurements, with journaled ones not flushed yet, into its slide if the date is
+            still in the rendered window
+        """
+        self.pending_dates.discard(date_str)
+        window = self.get_window()
+        if date_str in window and date_str != self.today_date:
+            measurements = App.get_running_app().app_data_dict['unpickleable']['database'].overlay_journal(
+                measurements, date_str)
+            self.date_texts[date_str] = self.gen_date_text(date_str, measurements)
+            self.ids['measurements_carousel'].slides[window.index(date_str)].text = self.date_texts[date_str]
+
+    def on_carousel_index(self, carousel, index):
+        """
+        on_carousel_index
+        args: self - self object
+            carousel - carousel widget
+            index - new slide index
+        purpose: slide the rendered window when the user swipes to a neighbouring date
+        """
+        if not self.rendering and index is not None and self.dates:
+            self.position = max(0, self.position - 1) + index
+            if self.position + 2 >= len(self.dates) and not self.all_dates_loaded:
+                self.load_more_dates()
+            self.render_window()
+
+    def query_done(self, date_str, future):
+        """
+        query_done
+        args: self - self object
+            date_str - ISO format date string of a measurements query, None for a dates query
+            future - concurrent.futures.Future of the query
+        purpose: run on the database thread when a query finishes, a failed query is released on the UI thread
+            so it can be requested again
+        """
+        if future.exception():
+            Logger.info(f'measurement_history: query for {date_str or "dates"} failed: {future.exception()}')
+            Clock.schedule_once(functools.partial(self.query_failed, date_str))
+
+    def query_failed(self, date_str, *kwargs):
+        """
+        query_failed
+        args: self - self object
+            date_str - ISO format date string of a measurements query, None for a dates query
+            kwargs - extra arguments from Clock
+        purpose: forget a failed query so the next render, swipe or save requests it again
+        """
+        if date_str is None:
+            self.loading_dates = False
+        elif date_str == self.today_date:
+            self.today_date = None
+        else:
+            self.pending_dates.discard(date_str)
+
+    def render_window(self):
+        """
+        render_window
+        args: self - self object
+        purpose: render the current date and its neighbours into the carousel, recycling labels
+        """
+        app = App.get_running_app()
+        carousel = self.ids['measurements_carousel']
+        first = max(0, self.position - 1)
+        window = self.get_window()
+        self.rendering = True
+        while len(carousel.slides) > len(window):
+            carousel.remove_widget(carousel.slides[-1])
+        while len(carousel.slides) < len(window):
+            carousel.add_widget(display_geometry.bind_window_height(Label(markup=True), 'font_size', 30, app=app))
+        for label, date_str in zip(carousel.slides, window):
+            label.text = self.get_date_text(date_str)
+        self.date_texts = {date_str: text for date_str, text in self.date_texts.items() if date_str in window}
+        if window:
+            carousel.index = self.position - first
+        self.rendering = False
+
+    def set_today_row(self, name, value, unit_type, measure_method, sort_key):
+        """
+        set_today_row
+        args: self - self object
+            name - name of measurement
+            value - value measured
+            unit_type - unit measurement is stored
+            measure_method - measurement method, may be None
+            sort_key - sort key for grouping output
+        purpose: render a single measurement line into today's model
+        """
+        if name != 'birth date':
+            self.today_rows[(name, measure_method)] = (sort_key, name,
+                self.gen_label_row(name, value, unit_type, measure_method))
+
+    def update_today_label(self, measurements):
+        """
+        update_today_label
+        args: self - self object
+            measurements - list of stored name, value, unit type, measure method and sort key tuples
+        purpose: apply stored measurements to today's model and refresh today's carousel label, the rest of today's
+            rows are requested from the database executor the first time
+        """
+        today = datetime.date.today().isoformat()
+        if self.today_date != today:
+            app = App.get_running_app()
+            self.today_date = today
+            self.today_rows = {}
+            future = app.app_data_dict['unpickleable']['database'].executor.submit('get_measurements_by_date', today,
+                callback=functools.partial(self.today_loaded, today))
+            future.add_done_callback(functools.partial(self.query_done, today))
+        for measurement in measurements:
+            self.set_today_row(*measurement)
+        if self.dates and self.dates[0] == today:
+            text = self.get_date_text(today)
+            if self.position <= 1:
+                self.ids['measurements_carousel'].slides[0].text = text
+        else:
+            if self.dates:
+                self.position += 1
+            self.dates.insert(0, today)
+            if self.position <= 1:
+                self.render_window()
+
+    def today_loaded(self, date_str, measurements, *kwargs):
+        """
+        today_loaded
+        args: self - self object
+            date_str - ISO format date string of the day requested
+            measurements - list of measurements for date sorted by sort key
+            kwargs - extra arguments from Clock
+        purpose: seed today's model with stored and journaled rows, keeping rows saved since the request, and
+            refresh its label
+        """
+        if date_str == self.today_date:
+            measurements = App.get_running_app().app_data_dict['unpickleable']['database'].overlay_journal(
+                measurements, date_str)
+            for measurement in measurements:
+                if (measurement['name'], measurement['measure_method']) not in self.today_rows:
+                    self.set_today_row(measurement['name'], measurement['value'], measurement['unit_type'],
+                        measurement['measure_method'], measurement['sort_key'])
+            if self.dates and self.dates[0] == date_str and self.position <= 1:
+                self.ids['measurements_carousel'].slides[0].text = self.get_date_text(date_str)
@@ -16,13 +16,14 @@
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from kivy.app import App
-from kivy.base import stopTouchApp
 from kivy.core.window import Window
 from kivy.logger import Logger
 from kivy.utils import platform
 #local imports
-import android_util
+import display_geometry
+import lazy_screen
 import over_press
+from image_touch_util import ImageTouchUtil
 from text_input_util import TextInputUtil
 
 __version__ = '1.0.0'
@@ -31,48 +32,34 @@ def calibrate_screen(app_data_dict):
     """
     calibrate_screen
     args: app_data_dict - application's data dictionary
-    purpose: establish screen dimensions
+    purpose: establish screen dimensions from the window and record them for the next start, a window sized by hand
+        with no_fullscreen keeps its stored scale
+    returns: boolean indicator as to if the dimensions changed
     """
-    with open('scale.kv', 'r') as file:
-       old_scale_text = file.read()
-    app_data_dict['window height'] = Window.height
-    app_data_dict['window width'] = Window.width
-    new_scale_text = '#:set window_width {}\n#:set window_height {}\n'.format(Window.width, Window.height)
-    if new_scale_text != old_scale_text:
-        with open('scale.kv', 'w') as file:
-           file.write(new_scale_text)
-        if platform == 'android':
-            android_util.reboot_android()
-        else:
-            app_data_dict['reset'] = True
-            stopTouchApp()
+    size = (Window.width, Window.height)
+    changed = size != (app_data_dict['window width'], app_data_dict['window height'])
+    app_data_dict['window width'], app_data_dict['window height'] = size
+    if changed and not os.path.exists('no_fullscreen'):
+        if platform not in ('android', 'ios'):
+            display_geometry.store_size(display_geometry.get_display_identity(), *size)
+        display_geometry.write_scale(*size)
+    return changed
 
 def determine_screen_size():
     """
     determine_screen_size
-    purpose: use tkinter to find screen size to fix Kivy screen scale issues
-    returns: tuple of screen width and height, (0, 0) if not fullscreened
+    purpose: find screen size to fix Kivy screen scale issues, using the display geometry cache so tkinter is only
+        loaded for a display not seen before
+    returns: tuple of screen width and height
     """
     if platform in ('android', 'ios'):
         width = Window.width
         height = Window.height
     elif os.path.exists('no_fullscreen'):
-        if os.path.exists('scale.kv'):
-            with open('scale.kv', 'r') as file:
-                line = file.readlines()
-                width = int(line[0].split()[2])
-                height = int(line[1].split()[2])
-        else:
-            width = 360
-            height = 720
+        width, height = display_geometry.read_scale() or (360, 720)
     else:
-        from tkinter import Tk
-        root = Tk()
-        width = root.winfo_screenwidth()
-        height = root.winfo_screenheight()
-        root.destroy()
-    with open('scale.kv', 'w') as file:
-        file.write(f'#:set window_width {width}\n#:set window_height {height}\n')
+        width, height = display_geometry.get_screen_size()
+    display_geometry.write_scale(width, height)
     return width, height
 
 def open_nav_drawer(self, *kwargs): # called from main.kv
@@ -98,12 +85,14 @@ def select_screen(select_item): # called form kv file
         unpickleable = app.app_data_dict['unpickleable']
         if select_item.selected:
             selected = app.navigation_map[select_item.text]
-            if selected['screen']:
+            if lazy_screen.get_screen(select_item.text, app=app):
                     unpickleable['vibrator'].vibrate('button')
                     app.root.ids['screen_container'].clear_widgets()
                     app.root.ids['screen_container'].add_widget(selected['screen'])
                     app.title = selected['title']
                     app.root.ids['nav_drawer'].set_state(new_state='close')
+                    if isinstance(selected['screen'], ImageTouchUtil):
+                        selected['screen'].preload_images()
         for screen in unpickleable.values():
             if isinstance(screen, TextInputUtil):
                 screen.defocus_all()
@@ -21,11 +21,9 @@ from kivy.logger import Logger
 from kivy.utils import platform
 from kivymd.uix.boxlayout import MDBoxLayout
 #local imports
+import linux_mobile_util
 import over_press
 
-if platform == 'linux':
-    import psutil
-
 class Quit(MDBoxLayout):
 
     def __init__(self, **kwargs):
@@ -35,7 +33,7 @@ class Quit(MDBoxLayout):
             kwargs - mystery arguments
         """
         super(MDBoxLayout, self).__init__(**kwargs)
-        if platform == 'android' or (platform == 'linux' and any(process.name() == 'phosh' for process in psutil.process_iter())):
+        if platform == 'android' or linux_mobile_util.get_session_environment()['phosh']:
             self.remove_widget(self.ids['minimize_button_container'])
 
     def maximize_button_press(self):
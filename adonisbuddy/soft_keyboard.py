@@ -14,10 +14,13 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
+import json
 from kivy.app import App
 from kivy.logger import Logger
 from kivy.uix.vkeyboard import VKeyboard
 from kivymd.uix.button import MDIconButton
+# local imports
+import display_geometry
 
 __version__ = '1.0.0'
 
@@ -32,17 +35,37 @@ layouts = {
     'text': 'squeek_qwerty_lower.json',
     'time': 'time_pad.json'
 }
+numpad_layouts = ('float_pad.json', 'int_pad.json', 'time_pad.json')
+parsed_layouts = {}
 
 def get_keyboard(key, app=None):
     """
     get_keyboard
     args: key - indicator as to which keybaord to return
         app - optional app object
-    purpose: return keyboard based on key
+    purpose: return keyboard based on key, building it on first use and sharing it with keys that use the same
+        layout file
     returns: specified keyboard widget
     """
+    global layouts
     app = app if app else App.get_running_app()
-    return app.app_data_dict['unpickleable'][f'software keyboard {key}']
+    keyboards = app.app_data_dict['unpickleable']['software keyboards']
+    layout = layouts[key]
+    if layout not in keyboards:
+        Logger.info(f'soft_keyboard: get_keyboard building {layout}')
+        kb = keyboards[layout] = VKeyboard(
+            available_layouts={layout: get_parsed_layout(layout)},
+            background_color=[0, 0, 0, 0],
+            do_rotation=False,
+            do_scale=False,
+            do_translation_x=False,
+            do_translation_y=False,
+            key_background_color=[0.6, 0.6, 0.6, 0.75],
+            key_border=[1, 1, 1, 1],
+            layout = layout)
+        kb.key_background_disabled_normal = kb.key_disabled_background_normal # fixes VKeyboard missing attribute bug
+        size_keyboard(kb, layout, app=app)
+    return keyboards[layout]
 
 def get_mounted_keyboard(app=None):
     """
@@ -51,42 +74,52 @@ def get_mounted_keyboard(app=None):
     purpose: find mounted keyboard
     returns: Kivy VKeyboard object of mounted keyboard
     """
-    global layouts
     app = app if app else App.get_running_app()
-    for layout in layouts:
-        kb = app.app_data_dict['unpickleable'][f'software keyboard {layout}']
-        if kb.parent:
-            return kb
-    return None
+    kb = app.app_data_dict['unpickleable']['mounted keyboard']
+    return kb if kb and kb.parent else None
+
+def get_parsed_layout(layout):
+    """
+    get_parsed_layout
+    args: layout - keyboard layout file name
+    purpose: parse a keyboard layout file once and cache it
+    returns: dictionary of keyboard layout
+    """
+    global parsed_layouts
+    if layout not in parsed_layouts:
+        with open(layout, 'r', encoding='utf-8') as file:
+            parsed_layouts[layout] = json.load(file)
+    return parsed_layouts[layout]
 
 def init_keyboards(app=None):
     """
     init_keyboards
     args: app - optional app object
-    purpose: initialize keyboards
+    purpose: initialize keyboard registry, keyboards are built on first use
     """
-    global layouts
     app = app if app else App.get_running_app()
     unpickleable = app.app_data_dict['unpickleable']
-    window_height = app.app_data_dict['window height']
-    numpad_height = window_height // 4
-    keyboard_height = window_height // 2.8
-    font_size = window_height // 30
-    width = int(app.app_data_dict['window width'] * 1.1)
-    for key, layout in layouts.items():
-        kb = unpickleable[f'software keyboard {key}'] = VKeyboard(
-            background_color=[0, 0, 0, 0],
-            do_rotation=False,
-            do_scale=False,
-            do_translation_x=False,
-            do_translation_y=False,
-            font_size=font_size,
-            height=(numpad_height if key in ('float','int','time') else keyboard_height),
-            key_background_color=[0.6, 0.6, 0.6, 0.75],
-            key_border=[1, 1, 1, 1],
-            layout = layout,
-            width=width)
-        kb.key_background_disabled_normal = kb.key_disabled_background_normal # fixes VKeyboard missing attribute bug
+    unpickleable['software keyboards'] = {}
+    unpickleable['mounted keyboard'] = None
+
+def mount_keyboard(container, key, key_press_method, app=None):
+    """
+    mount_keyboard
+    args: container - widget to mount keyboard onto
+        key - indicator as to which keybaord to mount
+        key_press_method - method to bind to for keypress processing
+        app - optional app object
+    purpose: mount keyboard and track it as the mounted keyboard
+    returns: keyboard widget
+    """
+    app = app if app else App.get_running_app()
+    kb = get_keyboard(key, app=app)
+    kb.on_key_up = key_press_method
+    if kb.parent:
+        kb.parent.remove_widget(kb)
+    container.add_widget(kb)
+    app.app_data_dict['unpickleable']['mounted keyboard'] = kb
+    return kb
 
 def remove_soft_keyboard(app = None):
     """
@@ -94,14 +127,12 @@ def remove_soft_keyboard(app = None):
     args: app - optional app object
     purpose: remove soft keyboard from screen
     """
-    global layouts
     Logger.info('soft_keyboard: remove_soft_keyboard')
     app = app if app else App.get_running_app()
-    unpickleable = app.app_data_dict['unpickleable']
-    for key in layouts:
-        kb = unpickleable[f'software keyboard {key}']
-        if kb.parent:
-            kb.parent.remove_widget(kb)
+    kb = get_mounted_keyboard(app=app)
+    if kb:
+        kb.parent.remove_widget(kb)
+    app.app_data_dict['unpickleable']['mounted keyboard'] = None
 
 def render_keyboard_shortcut(screen, app = None):
     """
@@ -114,11 +145,21 @@ def render_keyboard_shortcut(screen, app = None):
     app = app if app else App.get_running_app()
     button = None
     if app.app_data_dict['config']['software keyboard']['active']:
-        button = MDIconButton(icon='keyboard-outline', icon_size=app.app_data_dict['window height']//19)
+        button = display_geometry.bind_window_height(MDIconButton(icon='keyboard-outline'), 'icon_size', 19, app=app)
         screen.ids['keypad_button_container_id'].add_widget(button)
         button.bind(on_release=screen.summon_keyboard_press)
     return button
 
+def resize_keyboards(app=None):
+    """
+    resize_keyboards
+    args: app - optional app object
+    purpose: resize built keyboards in place after the window size changed
+    """
+    app = app if app else App.get_running_app()
+    for layout, kb in app.app_data_dict['unpickleable']['software keyboards'].items():
+        size_keyboard(kb, layout, app=app)
+
 def set_keyboard_layout(parent, layout, key_press_method, app=None):
     """
     set_keyboard_layout
@@ -132,6 +173,19 @@ def set_keyboard_layout(parent, layout, key_press_method, app=None):
     app = app if app else App.get_running_app()
     parent.ids['keypad_container_id'].clear_widgets()
     if app.app_data_dict['config']['software keyboard']['active']:
-        kb = app.app_data_dict['unpickleable'][f'software keyboard {layout}']
-        kb.on_key_up = key_press_method
-        parent.ids['keypad_container_id'].add_widget(kb)
+        mount_keyboard(parent.ids['keypad_container_id'], layout, key_press_method, app=app)
+
+def size_keyboard(kb, layout, app=None):
+    """
+    size_keyboard
+    args: kb - keyboard widget
+        layout - layout file name of keyboard
+        app - optional app object
+    purpose: size keyboard from window dimensions
+    """
+    global numpad_layouts
+    app = app if app else App.get_running_app()
+    window_height = app.app_data_dict['window height']
+    kb.font_size = window_height // 30
+    kb.height = window_height // 4 if layout in numpad_layouts else window_height // 2.8
+    kb.width = int(app.app_data_dict['window width'] * 1.1)
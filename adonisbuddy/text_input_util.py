@@ -50,11 +50,8 @@ class TextInputUtil(HardKeyboardState):
         """
         app = App.get_running_app()
         if app.app_data_dict['config']['software keyboard']['active']:
-            keypad = soft_keyboard.get_keyboard(input_field.input_field_type, app=app)
-            keypad.on_key_up = self.soft_key_press
-            if keypad.parent:
-                keypad.parent.remove_widget(keypad)
-            self.ids['keypad_container_id'].add_widget(keypad)
+            soft_keyboard.mount_keyboard(self.ids['keypad_container_id'], input_field.input_field_type,
+                self.soft_key_press, app=app)
         if app.app_data_dict['config']['hardware keyboard']['active']:
             hard_keyboard.get_hard_keyboard(input_field, on_key_down=self.hard_key_press,
                                             on_key_up=self.hard_key_release)
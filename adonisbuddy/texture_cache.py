@@ -0,0 +1,134 @@
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import functools
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from kivy.clock import Clock
+from kivy.core.image import ImageLoader
+from kivy.graphics.texture import Texture
+from kivy.logger import Logger
+
+class TextureCache:
+    """
+    TextureCache
+    purpose: LRU cache of image textures with a background worker that decodes images off the UI thread
+    """
+    limit = 12
+    load_queue = None
+    pending = None
+    textures = None
+    worker = None
+
+    def __init__(self, limit=None):
+        """
+        __init__
+        args: self - self object
+            limit - optional maximum number of textures to keep
+        purpose: create an empty texture cache, the worker thread is started on first preload
+        """
+        self.limit = limit if limit else self.limit
+        self.load_queue = queue.Queue()
+        self.pending = {}
+        self.textures = OrderedDict()
+
+    def add_texture(self, path, image_data, *kwargs):
+        """
+        add_texture
+        args: self - self object
+            path - image file path
+            image_data - decoded kivy ImageData
+            kwargs - extra arguments from Clock
+        purpose: upload decoded image data to a texture on the UI thread and evict the least recently used textures
+        returns: texture object
+        """
+        self.pending.pop(path, None)
+        if path not in self.textures:
+            self.textures[path] = Texture.create_from_data(image_data)
+        self.textures.move_to_end(path)
+        while len(self.textures) > self.limit:
+            self.textures.popitem(last=False)
+        return self.textures[path]
+
+    def decode(self, path):
+        """
+        decode
+        args: self - self object
+            path - image file path
+        purpose: decode an image file without creating a texture
+        returns: kivy ImageData object
+        """
+        return ImageLoader.load(path, keep_data=True)._data[0]
+
+    def get(self, path):
+        """
+        get
+        args: self - self object
+            path - image file path
+        purpose: retrieve a texture, waiting for its decode if the worker has started it, or else taking it from the
+            queue and decoding it on the calling thread
+        returns: texture object
+        """
+        if path in self.textures:
+            self.textures.move_to_end(path)
+            return self.textures[path]
+        future = self.pending.get(path)
+        if future and not future.cancel():
+            try:
+                return self.add_texture(path, future.result())
+            except Exception:
+                pass
+        return self.add_texture(path, self.decode(path))
+
+    def preload(self, paths):
+        """
+        preload
+        args: self - self object
+            paths - list of a screen's image file paths
+        purpose: queue images for background decoding, growing the limit so a whole screen's images fit
+        """
+        if not self.worker:
+            self.worker = threading.Thread(target=self.work, daemon=True)
+            self.worker.start()
+        self.limit = max(self.limit, len(paths))
+        for path in paths:
+            if path in self.textures:
+                self.textures.move_to_end(path)
+            elif path not in self.pending:
+                self.pending[path] = Future()
+                self.load_queue.put((path, self.pending[path]))
+
+    def work(self):
+        """
+        work
+        args: self - self object
+        purpose: worker thread loop decoding queued images and handing them to the UI thread for upload
+        """
+        while True:
+            path, future = self.load_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                image_data = self.decode(path)
+            except Exception as e:
+                Logger.info(f'texture_cache: unable to decode {path}: {str(e)}')
+                future.set_exception(e)
+                self.pending.pop(path, None)
+                continue
+            future.set_result(image_data)
+            Clock.schedule_once(functools.partial(self.add_texture, path, image_data))
@@ -0,0 +1,176 @@
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import json
+import math
+import mmap
+import os
+import re
+from kivy.logger import Logger
+
+NONZERO_RUN = re.compile(rb'[^\x00]+')
+
+class TouchMask:
+    """
+    TouchMask
+    purpose: label mask of a screen's touch images where each byte holds the index of the body part at that pixel
+    """
+    boxes = None
+    mask = None
+    mask_height = 0
+    mask_width = 0
+    names = None
+    scale = 1
+
+    def __init__(self):
+        """
+        __init__
+        args: self - self object
+        purpose: create an empty touch mask, populate it with build or load
+        """
+        self.boxes = {}
+        self.names = [None]
+
+    def add_image(self, image_data, label):
+        """
+        add_image
+        args: self - self object
+            image_data - kivy ImageData of a touch image
+            label - index to store for opaque pixels
+        purpose: stamp the opaque pixels of a touch image into the mask
+        """
+        translate_table = bytes([0] + [label] * 255)
+        alpha_offset = 0 if image_data.fmt in ('argb', 'abgr') else 3
+        stride = (image_data.rowlength or image_data.width) * 4
+        box = None
+        for mask_y, y in enumerate(range(0, image_data.height, self.scale)):
+            start = y * stride + alpha_offset
+            alpha = bytes(image_data.data[start:start + image_data.width * 4:4 * self.scale])
+            offset = mask_y * self.mask_width
+            for run in NONZERO_RUN.finditer(alpha.translate(translate_table)):
+                self.mask[offset + run.start():offset + run.end()] = run.group()
+                box = [min(box[0], run.start()), box[1], max(box[2], run.end()), mask_y + 1] if box else \
+                    [run.start(), mask_y, run.end(), mask_y + 1]
+        if box:
+            self.boxes[self.names[label]] = box
+
+    def build(self, touch_images, scale=1):
+        """
+        build
+        args: self - self object
+            touch_images - iterable of body part name and kivy ImageData tuples, all the same size
+            scale - optional downsample factor, a scale of 2 keeps every second pixel of every second row
+        purpose: build the label mask one image at a time, later touch images win where parts overlap
+        """
+        self.boxes = {}
+        self.names = [None]
+        self.scale = scale
+        for name, image_data in touch_images:
+            if self.mask is None:
+                self.mask_width = math.ceil(image_data.width / scale)
+                self.mask_height = math.ceil(image_data.height / scale)
+                self.mask = bytearray(self.mask_width * self.mask_height)
+            self.names.append(name)
+            self.add_image(image_data, len(self.names) - 1)
+
+    def get_highlight(self, name):
+        """
+        get_highlight
+        args: self - self object
+            name - body part name
+        purpose: cut a body part's region out of the mask as an overlay sprite
+        returns: tuple of x, y from top, width and height in mask pixels plus bottom up luminance alpha pixel bytes,
+            None if the part has no region
+        """
+        if name not in self.boxes:
+            return None
+        x0, y0, x1, y1 = self.boxes[name]
+        width = x1 - x0
+        label = self.names.index(name)
+        translate_table = bytes(255 if index == label else 0 for index in range(256))
+        alpha = b''.join(bytes(self.mask[y * self.mask_width + x0:y * self.mask_width + x1]).translate(translate_table)
+            for y in range(y1 - 1, y0 - 1, -1))
+        pixels = bytearray(len(alpha) * 2)
+        pixels[0::2] = b'\xff' * len(alpha)
+        pixels[1::2] = alpha
+        return x0, y0, width, y1 - y0, bytes(pixels)
+
+    def load(self, file_name, sources, scale):
+        """
+        load
+        args: self - self object
+            file_name - mask cache file name
+            sources - list describing the touch images the mask must have been built from
+            scale - downsample factor the mask must have been built with
+        purpose: memory map a cached mask so only the pages a touch reads become resident
+        returns: boolean indicator as to if a valid cached mask was loaded
+        """
+        if not os.path.exists(file_name):
+            return False
+        try:
+            with open(file_name, 'rb') as file:
+                header_line = file.readline()
+                header = json.loads(header_line)
+                if header['sources'] != sources or header['scale'] != scale or 'boxes' not in header:
+                    return False
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError) as e:
+            Logger.info(f'touch_mask: ignoring unreadable mask cache {file_name}: {str(e)}')
+            return False
+        mask = memoryview(mapped)[len(header_line):]
+        if len(mask) != header['width'] * header['height']:
+            return False
+        self.boxes = header['boxes']
+        self.mask = mask
+        self.mask_width = header['width']
+        self.mask_height = header['height']
+        self.names = header['names']
+        self.scale = scale
+        return True
+
+    def lookup(self, x, y):
+        """
+        lookup
+        args: self - self object
+            x - x coordinate in touch image pixels
+            y - y coordinate in touch image pixels, from the top of the image
+        purpose: find the body part at a touch image coordinate
+        returns: body part name or None if no part is at the coordinate
+        """
+        x = int(x) // self.scale
+        y = int(y) // self.scale
+        if self.mask is not None and 0 <= x < self.mask_width and 0 <= y < self.mask_height:
+            return self.names[self.mask[y * self.mask_width + x]]
+        return None
+
+    def save(self, file_name, sources):
+        """
+        save
+        args: self - self object
+            file_name - mask cache file name
+            sources - list describing the touch images the mask was built from
+        purpose: write the mask to a cache file for memory mapping on later starts
+        """
+        header = {'boxes': self.boxes, 'height': self.mask_height, 'names': self.names, 'scale': self.scale,
+            'sources': sources, 'width': self.mask_width}
+        temp_file_name = f'{file_name}.tmp'
+        try:
+            with open(temp_file_name, 'wb') as file:
+                file.write(json.dumps(header).encode() + b'\n')
+                file.write(self.mask)
+            os.replace(temp_file_name, file_name)
+        except OSError as e:
+            Logger.info(f'touch_mask: unable to write mask cache {file_name}: {str(e)}')
@@ -14,9 +14,14 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with the Pantheon suite.  If not, see <https://www.gnu.org/licenses/>.
+import functools
+import threading
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.utils import platform
 from kivy.logger import Logger
+# local imports
+import lazy_screen
 
 __version__ = '1.0.0'
 
@@ -33,6 +38,7 @@ class Vibrator:
     button_press_duration = 100
     alarm_duration = 1000
     vibrator_device = None
+    vibrator_found = False
 
     def __init__(self):
         """
@@ -65,33 +71,93 @@ class Vibrator:
         if vibrator.exists():
             for key in self.durations:
                 self.durations[key]['seconds'] = self.durations[key]['ms'] / 1000
-            app = App.get_running_app()
-            app.app_data_dict['unpickleable']['config'].enable_button('vibrate')
+            self.enable_config_button()
+
+    def enable_config_button(self, app=None):
+        """
+        enable_config_button
+        args: self - self object
+            app - optional app object
+        purpose: record that a vibrator was found and add its toggle to the config screen if it is built, a config
+            screen built later reads vibrator_found instead
+        """
+        app = app if app else App.get_running_app()
+        self.vibrator_found = True
+        unpickleable = app.app_data_dict['unpickleable']
+        if 'config' in unpickleable and lazy_screen.is_built(unpickleable['config']):
+            unpickleable['config'].enable_button('vibrate')
+
+    def find_linux_device(self, cached_path):
+        """
+        find_linux_device
+        args: self - self object
+            cached_path - device path found on an earlier run, None if not known
+        purpose: find the vibrator input device, checking the cached path with one open before scanning every input
+            device, and register its effects, runs on a worker thread
+        """
+        device = self.open_linux_device(cached_path) if cached_path else None
+        if not device:
+            for path in evdev.list_devices():
+                if path != cached_path:
+                    device = self.open_linux_device(path)
+                    if device:
+                        break
+        if device:
+            for key in self.durations:
+                self.durations[key]['effect'] = self.register_linux_rumble_effect(self.durations[key]['ms'],
+                    device=device)
+            Clock.schedule_once(functools.partial(self.linux_device_found, device))
+
+    def linux_device_found(self, device, *kwargs):
+        """
+        linux_device_found
+        args: self - self object
+            device - vibrator input device
+            kwargs - extra arguments from Clock
+        purpose: make the vibrator available on the UI thread and remember its path for the next run
+        """
+        self.vibrator_device = device
+        app = App.get_running_app()
+        vibrate_config = app.app_data_dict['config']['vibrate']
+        if vibrate_config.get('device path') != device.path:
+            vibrate_config['device path'] = device.path
+            app.app_data_dict['unpickleable']['database'].store_config(app.app_data_dict['config'])
+        self.enable_config_button(app=app)
 
     def linux_init(self):
         """
         linux_init
         args: self - self object
-        purpose: initialize vibrator for Linux
+        purpose: initialize vibrator for Linux, the device is discovered off the UI thread
         """
         self.vibrator_device = None
-        for path in evdev.list_devices():
+        app = App.get_running_app()
+        cached_path = app.app_data_dict['config']['vibrate'].get('device path')
+        threading.Thread(target=self.find_linux_device, args=(cached_path,), name='vibrator', daemon=True).start()
+
+    def open_linux_device(self, path):
+        """
+        open_linux_device
+        args: self - self object
+            path - input device path
+        purpose: open an input device if it is the vibrator
+        returns: input device object, None if the path is not the vibrator
+        """
+        try:
             device = evdev.InputDevice(path)
-            if device.name == 'gpio-vibrator':
-                self.vibrator_device = device
-                break
-            device.close()
-        if self.vibrator_device:
-            for key in self.durations:
-                self.durations[key]['effect'] = self.register_linux_rumble_effect(self.durations[key]['ms'])
-            app = App.get_running_app()
-            app.app_data_dict['unpickleable']['config'].enable_button('vibrate')
+        except OSError:
+            return None
+        if device.name == 'gpio-vibrator':
+            return device
+        device.close()
+        return None
 
-    def register_linux_rumble_effect(self, duration):
+    def register_linux_rumble_effect(self, duration, device=None):
         """
         register_linux_rumble_effect
         args: self - self object
             duration - length of rumble in ms
+            device - optional input device, defaults to the vibrator device
         purpose: register a vibrator effect
         returns: effect id for interfacing with vibrator hardware
         """
@@ -102,7 +168,7 @@ class Vibrator:
             effect_trigger = ff.Trigger(0, 0)
             effect_replay = ff.Replay(duration, 0)
             effect = ff.Effect(ecodes.FF_RUMBLE, -1, 0, effect_trigger, effect_replay, effect_type)
-            effect_id = self.vibrator_device.upload_effect(effect)
+            effect_id = (device if device else self.vibrator_device).upload_effect(effect)
         except Exception as e:
             Logger.info('Vibrator: exception setting up vibrator: {}'.format(str(e)))
         return effect_id
@@ -16,14 +16,14 @@
 # along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
 import kivy
-import os
+import time
 from kivy.base import stopTouchApp
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.utils import platform
 from kivy.loader import Loader
 from kivy.logger import Logger
-from kivy.properties import BooleanProperty, StringProperty
+from kivy.properties import BooleanProperty, NumericProperty, StringProperty
 from kivymd.app import MDApp
 #local imports
 import about
@@ -34,8 +34,10 @@ import composition_measurements
 import config
 import database
 import datadict
+import lazy_screen
 import linux_mobile_util
 import measurement_history
+import pantheon_util
 import quit
 import soft_keyboard
 import sound
@@ -49,35 +51,54 @@ class AdonisBuddyApp(MDApp):
     load_disable = BooleanProperty(True)
     navigation_map = {
         'About': {
+            'factory': about.About,
             'title': 'About',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'about'
         },
         'Calipers': {
+            'factory': calipers.Calipers,
             'title': 'Body Fat Calipers',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'calipers'
         },
         'Composition': {
+            'factory': composition_measurements.CompositionMeasurements,
             'title': 'Composition Measurements',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'composition'
         },
         'Config': {
+            'factory': config.Config,
             'title': 'Configure Features',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'config'
         },
         'History': {
+            'factory': measurement_history.MeasurementHistory,
             'title': 'Measurements History',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'history'
         },
         'Measurements': {
+            'factory': body_measurements.BodyMeasurements,
             'title': 'Body Measurements',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'body measurements'
         },
         'Quit': {
+            'factory': quit.Quit,
             'title': 'Quit',
-            'screen': None
+            'screen': None,
+            'unpickleable key': 'quit'
         }
     }
+    startup_stages = []
+    startup_start = 0.0
+    startup_timings = {}
     title = StringProperty('Adonis Buddy')
+    window_height = NumericProperty(720)
+    window_width = NumericProperty(360)
 
     def __init__(self, data_dict):
         """
@@ -89,6 +110,8 @@ class AdonisBuddyApp(MDApp):
         """
         self.app_data_dict = data_dict
         super(AdonisBuddyApp, self).__init__()
+        self.window_width = data_dict['window width']
+        self.window_height = data_dict['window height']
 
     def build(self): # called from Kivy engine
         """
@@ -110,42 +133,75 @@ class AdonisBuddyApp(MDApp):
         self.theme_cls.theme_style = "Dark"
         self.theme_cls.primary_hue = "200"
         self.icon = 'adonis_buddy.png'
-        if os.path.exists('no_load_sleep'):
-            self.load_slow_resources(None)
-        else:
-            Clock.schedule_once(self.load_slow_resources, (4 if platform == 'android' else 2))
+        self.startup_start = time.perf_counter()
+        for selected in self.navigation_map.values():
+            selected['screen'] = None
+        self.startup_stages = [
+            ('data dict', self.load_data_dict),
+            ('first screen', self.load_first_screen),
+            ('birth date dialog', self.load_birth_date_dialog),
+            ('squeekboard', linux_mobile_util.disable_squeekboard)
+        ]
+        Clock.schedule_once(self.load_next_stage)
+
+    def load_birth_date_dialog(self):
+        """
+        load_birth_date_dialog
+        args: self - self object
+        purpose: build the birth date picker dialog
+        """
+        self.app_data_dict['unpickleable']['birth date dialog'] = DatePicker(firstweekday=6,
+            max_year=datetime.date.today().year+1, color_picker_func=lambda x, y: [])
 
-    def load_slow_resources(self, dt):
+    def load_data_dict(self):
         """
-        load_slow_resources
+        load_data_dict
         args: self - self object
-            dt - time since last callback call
-        purpose: load slow loading resources
+        purpose: load the data dictionary, soft keyboards and the services every screen depends on, screens are
+            represented by proxies until first use
         """
-        Logger.info('view: load_slow_resource')
         data_dict_obj = datadict.DataDict()
         data_dict_obj.get_data_dict(self.app_data_dict)
+        lazy_screen.install_proxies(app=self)
         soft_keyboard.init_keyboards()
         unpickleable = self.app_data_dict['unpickleable']
-        unpickleable['about'] = self.navigation_map['About']['screen'] = about.About()
-        unpickleable['birth date dialog'] = DatePicker(firstweekday=6, max_year=datetime.date.today().year+1,
-            color_picker_func=lambda x, y: [])
-        unpickleable['body measurements'] = self.navigation_map['Measurements']['screen'] = \
-            body_measurements.BodyMeasurements()
-        unpickleable['calipers'] = self.navigation_map['Calipers']['screen'] = calipers.Calipers()
-        unpickleable['composition'] = self.navigation_map['Composition']['screen'] = \
-            composition_measurements.CompositionMeasurements()
-        unpickleable['config'] = self.navigation_map['Config']['screen'] = config.Config()
         unpickleable['confirmation popup'] = ConfirmationPopupWindow()
-        unpickleable['history'] = self.navigation_map['History']['screen'] = measurement_history.MeasurementHistory()
-        unpickleable['quit'] = self.navigation_map['Quit']['screen'] = quit.Quit()
         unpickleable['sound'] = sound.Sound(unpickleable['database'])
         unpickleable['vibrator'] = vibrator.Vibrator()
-        linux_mobile_util.disable_squeekboard()
+
+    def load_first_screen(self):
+        """
+        load_first_screen
+        args: self - self object
+        purpose: build the Measurements screen and replace the loading screen with it
+        """
+        lazy_screen.get_screen('Measurements', app=self)
         self.root.ids['screen_container'].clear_widgets()
         self.root.ids['screen_container'].add_widget(self.navigation_map['Measurements']['screen'])
         self.title = self.navigation_map['Measurements']['title']
-        self.load_disable = False
+        Clock.schedule_once(self.navigation_map['Measurements']['screen'].preload_images)
+        Logger.info(f'view: startup: first screen interactive after '
+            f'{(time.perf_counter() - self.startup_start) * 1000:.0f} ms')
+
+    def load_next_stage(self, *kwargs):
+        """
+        load_next_stage
+        args: self - self object
+            *kwargs - optional arguments so it can be called from Clock
+        purpose: run the next startup stage and schedule the one after it for the following frame, so the first
+            screen is shown as soon as its own dependencies are loaded
+        """
+        stage_name, stage = self.startup_stages.pop(0)
+        stage_start = time.perf_counter()
+        stage()
+        self.startup_timings[stage_name] = (time.perf_counter() - stage_start) * 1000
+        Logger.info(f'view: startup: {stage_name} took {self.startup_timings[stage_name]:.0f} ms')
+        if self.startup_stages:
+            Clock.schedule_once(self.load_next_stage)
+        else:
+            self.load_disable = False
+            Window.bind(size=Clock.create_trigger(self.resize_layout, 0.2))
+            Logger.info(f'view: startup: finished after {(time.perf_counter() - self.startup_start) * 1000:.0f} ms')
 
     def on_pause(self):
         """
@@ -155,6 +211,9 @@ class AdonisBuddyApp(MDApp):
         returns: True
         """
         Logger.info('view: on_pause')
+        if 'unpickleable' in self.app_data_dict:
+            self.app_data_dict['unpickleable']['database'].flush_config()
+            self.app_data_dict['unpickleable']['database'].drain_journal()
         return True
 
     def on_resume(self): # called from Kivy engine on Android
@@ -181,5 +240,24 @@ class AdonisBuddyApp(MDApp):
         purpose: shutdown app
         """
         Logger.info('view: on_stop')
+        if 'unpickleable' in self.app_data_dict:
+            self.app_data_dict['unpickleable']['database'].flush_config()
+            self.app_data_dict['unpickleable']['database'].drain_journal()
         linux_mobile_util.enable_squeekboard()
+        linux_mobile_util.wait_squeekboard()
         stopTouchApp()
+
+    def resize_layout(self, *kwargs):
+        """
+        resize_layout
+        args: self - self object
+            *kwargs - optional arguments so it can be called from Clock
+        purpose: apply a window size change in place, kv sizes follow the window properties and keyboards are resized
+        """
+        resize_start = time.perf_counter()
+        if pantheon_util.calibrate_screen(self.app_data_dict):
+            self.window_width = self.app_data_dict['window width']
+            self.window_height = self.app_data_dict['window height']
+            soft_keyboard.resize_keyboards(app=self)
+            Logger.info(f'view: resize_layout: {self.window_width}x{self.window_height} applied in '
+                f'{(time.perf_counter() - resize_start) * 1000:.0f} ms')
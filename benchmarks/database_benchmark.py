@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import argparse
+import datetime
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adonisbuddy'))
+import database
+import database_util
+
+INSERT_SQL = """
+    INSERT INTO measurements
+    (date, name, value, unit_type, measure_method, sort_key)
+    VALUES(?, ?, ?, ?, ?, ?)
+"""
+LEGACY_UPDATE_SQL = """
+    UPDATE measurements
+    SET value = ?,
+        unit_type = ?
+    WHERE date = ? AND
+        name = ? AND
+        measure_method IS NULL
+"""
+NAMES = ('chest', 'waist', 'hip', 'neck', 'left arm', 'right arm', 'left thigh', 'right thigh', 'weight', 'height')
+
+def fill_measurements(db, row_count):
+    """
+    fill_measurements
+    args: db - open metrics database
+        row_count - number of rows to generate
+    purpose: populate the measurements table with one row per name per day going back in time
+    """
+    today = datetime.date.today()
+    rows = []
+    for index in range(row_count):
+        date_str = (today - datetime.timedelta(days=index // len(NAMES) + 1)).isoformat()
+        rows.append((date_str, NAMES[index % len(NAMES)], 30.0 + index % 17, 'in', None, 1.0))
+    db.executemany(INSERT_SQL, rows)
+    db.commit()
+
+def history_read(db):
+    """
+    history_read
+    args: db - open metrics database
+    purpose: read every row the way the history screen does
+    """
+    for measurement in database_util.basic_query(db,
+            'SELECT * FROM measurements ORDER BY date DESC, sort_key ASC, name ASC'):
+        (measurement['date'], measurement['name'], measurement['value'], measurement['unit_type'],
+            measurement['measure_method'], measurement['sort_key'])
+
+def lookups(db, count):
+    """
+    lookups
+    args: db - open metrics database
+        count - number of lookups to run
+    purpose: run get_measurement style queries
+    """
+    date_str = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+    for index in range(count):
+        database_util.basic_query(db, database.Database.statements['get measurement'],
+            values=(date_str, NAMES[index % len(NAMES)]))
+
+def saves(db, count):
+    """
+    saves
+    args: db - open metrics database
+        count - number of saves to run
+    purpose: run legacy store_measurement style read then write saves, each with its own commit
+    """
+    statements = database.Database.statements
+    date_str = datetime.date.today().isoformat()
+    for index in range(count):
+        name = NAMES[index % len(NAMES)]
+        if database_util.basic_query(db, statements['get measurement'], values=(date_str, name)):
+            database_util.basic_edit(db, LEGACY_UPDATE_SQL, (float(index), 'in', date_str, name))
+        else:
+            database_util.basic_edit(db, INSERT_SQL,
+                (date_str, name, float(index), 'in', None, 1.0))
+
+def upsert_saves(db, count):
+    """
+    upsert_saves
+    args: db - open metrics database
+        count - number of saves to run
+    purpose: run single statement upsert saves, each with its own commit
+    """
+    date_str = datetime.date.today().isoformat()
+    for index in range(count):
+        database_util.basic_edit(db, database.Database.statements['upsert measurement'],
+            (date_str, NAMES[index % len(NAMES)], float(index), 'in', None, 1.0))
+
+def time_it(func, *args):
+    """
+    time_it
+    args: func - function to time
+        args - arguments for function
+    purpose: time a function call
+    returns: elapsed seconds
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def main():
+    """
+    main
+    purpose: compare the legacy connection against the tuned Database connection
+    """
+    parser = argparse.ArgumentParser(description='Adonis Buddy database micro-benchmark')
+    parser.add_argument('--rows', type=int, default=100000, help='rows in the measurements table')
+    parser.add_argument('--lookups', type=int, default=2000, help='number of get_measurement lookups')
+    parser.add_argument('--saves', type=int, default=200, help='number of store_measurement saves')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        db = database.Database()
+        legacy_conn = sqlite3.connect(os.path.join(temp_dir, 'legacy.sqlite3'))
+        db.create_measurements_table(legacy_conn.cursor())
+        db.create_measurements_index(legacy_conn)
+        connections = {'legacy': legacy_conn, 'tuned': db.metrics_db}
+        for conn in connections.values():
+            fill_measurements(conn, args.rows)
+        print(f'{"path":<8}{"history read":>16}{"lookups":>16}{"saves":>16}{"upsert saves":>16}')
+        for label, conn in connections.items():
+            read_time = time_it(history_read, conn)
+            lookup_time = time_it(lookups, conn, args.lookups)
+            save_time = time_it(saves, conn, args.saves)
+            upsert_time = time_it(upsert_saves, conn, args.saves)
+            print(f'{label:<8}{read_time:>15.3f}s{lookup_time:>15.3f}s{save_time:>15.3f}s{upsert_time:>15.3f}s')
+        for conn in connections.values():
+            conn.close()
+        os.chdir('/')
+
+if __name__ == '__main__':
+    main()
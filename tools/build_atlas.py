@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright (C) 2025 Cory Jon Hollingsworth
+#
+# This file is part of Adonis Buddy.
+#
+# Adonis Buddy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This file is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Adonis Buddy.  If not, see <https://www.gnu.org/licenses/>.
+import argparse
+import functools
+import glob
+import json
+import os
+import sys
+import tempfile
+from kivy.atlas import Atlas
+from PIL import Image, ImageChops
+
+BASE_IMAGES = {
+    'caliper-model-': 'caliper-model.png',
+    'measurement-model-': 'measurement-model.png'
+}
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adonisbuddy', 'images')
+
+def crop_highlights(sprite_dir):
+    """
+    crop_highlights
+    args: sprite_dir - directory to write cropped sprites to
+    purpose: crop every selected image down to the region where it differs from its base model image
+    returns: tuple of region dictionary keyed by selected image file and list of sprite files
+    """
+    regions = {}
+    sprite_files = []
+    base_cache = {}
+    for selected_path in sorted(glob.glob(os.path.join(IMAGES_DIR, '*-selected.png'))):
+        selected_file = os.path.basename(selected_path)
+        base_file = next((base for prefix, base in BASE_IMAGES.items() if selected_file.startswith(prefix)), None)
+        if not base_file:
+            continue
+        if base_file not in base_cache:
+            base_cache[base_file] = Image.open(os.path.join(IMAGES_DIR, base_file)).convert('RGBA')
+        selected = Image.open(selected_path).convert('RGBA')
+        # combine the bands first, an RGBA image's getbbox only looks at alpha
+        box = functools.reduce(ImageChops.lighter, ImageChops.difference(base_cache[base_file], selected).split()
+            ).getbbox()
+        if box:
+            sprite_id = selected_file[:-len('.png')]
+            sprite_path = os.path.join(sprite_dir, selected_file)
+            selected.crop(box).save(sprite_path)
+            sprite_files.append(sprite_path)
+            regions[selected_file] = {'id': sprite_id, 'x': box[0], 'y': box[1], 'width': box[2] - box[0],
+                'height': box[3] - box[1]}
+        else:
+            regions[selected_file] = {'id': None, 'x': 0, 'y': 0, 'width': 0, 'height': 0}
+    return regions, sprite_files
+
+def main():
+    """
+    main
+    purpose: build images/highlights.atlas and images/highlights.json from the selected body model images
+    """
+    parser = argparse.ArgumentParser(description='Build the Adonis Buddy highlight atlas')
+    parser.add_argument('--size', type=int, default=1024, help='atlas page size in pixels')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as sprite_dir:
+        regions, sprite_files = crop_highlights(sprite_dir)
+        if sprite_files and not Atlas.create(os.path.join(IMAGES_DIR, 'highlights'), sprite_files, args.size):
+            print('build_atlas: atlas creation failed, try a larger --size')
+            sys.exit(1)
+    with open(os.path.join(IMAGES_DIR, 'highlights.json'), 'w') as file:
+        json.dump(regions, file, indent=4, sort_keys=True)
+    print(f'build_atlas: {len(sprite_files)} highlight sprites packed from {len(regions)} selected images')
+
+if __name__ == '__main__':
+    main()